@@ -1,15 +1,21 @@
 # backend/app/api/matches.py
 
-from datetime import date
-from typing import List, Optional
+from datetime import date, time
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Header, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..db.session import get_db
 from ..models.match import Match as MatchModel
 from ..models.participation import Participation as ParticipationModel
 from ..schemas import Match, MatchCreate, MatchUpdate
+from ..services.booking import find_schedule_conflict, find_venue_conflict
+from ..services.catalog import get_catalog
+from ..services.match_cache import match_cache
+from ..services.outbox import enqueue_match_event
+from ..services.participation import get_participation, set_participation
 
 router = APIRouter(prefix="/matches", tags=["matches"])
 
@@ -28,6 +34,73 @@ def get_current_user_id(x_user_id: Optional[int] = Header(default=None)) -> int:
     return 1
 
 
+# -------------------------------
+# Single-match lookup for write paths
+# -------------------------------
+def get_match_or_404(db: Session, match_id: int) -> MatchModel:
+    """
+    Load the ORM row (writes need it attached to the session).
+    Reads go through match_cache instead.
+    """
+    match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
+    if not match:
+        raise HTTPException(status_code=404, detail="Match not found")
+    return match
+
+
+# -------------------------------
+# Venue double-booking guard
+# -------------------------------
+def ensure_venue_free(
+    db: Session,
+    location: str,
+    on_date: date,
+    start_time: time,
+    end_time: Optional[time],
+    exclude_match_id: Optional[int] = None,
+) -> None:
+    """
+    Reject overlapping bookings at the same location (409).
+    Check-then-write with no DB constraint: two concurrent requests can
+    still book the same slot; the availability view shows such overlaps
+    merged so they can be cleaned up.
+    """
+    conflict = find_venue_conflict(
+        db, location, on_date, start_time, end_time, exclude_match_id
+    )
+    if conflict:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Venue is already booked by match {conflict.id} at that time.",
+        )
+
+
+# -------------------------------
+# Sport/category resolution against the catalog
+# -------------------------------
+def resolve_sport(
+    db: Session,
+    sport: Optional[str],
+    category: Optional[str],
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Map sport (code or name) and category code to catalog ids.
+    - Unknown sport: kept as a free string, sport_id=None
+    - Category requires a known sport and must belong to it (400)
+    """
+    catalog = get_catalog(db)
+    sport_id = catalog.sport_id(sport)
+
+    category_id = None
+    if category:
+        if sport_id is not None:
+            category_id = catalog.category_id(sport_id, category)
+        if category_id is None:
+            raise HTTPException(status_code=400, detail="Unknown category for this sport.")
+
+    return sport_id, category_id
+
+
 # -------------------------------
 # 1. Create match - POST /matches/
 # -------------------------------
@@ -42,6 +115,18 @@ def create_match(
     else:
         data = match_in.dict()
 
+    data["sport_id"], data["category_id"] = resolve_sport(
+        db, data.get("sport"), data.pop("category", None)
+    )
+
+    ensure_venue_free(
+        db,
+        data["location"],
+        data["date"],
+        data["start_time"],
+        data.get("end_time"),
+    )
+
     db_match = MatchModel(
         **data,
         owner_id=current_user_id,  # creator
@@ -51,6 +136,7 @@ def create_match(
     db.add(db_match)
     db.commit()
     db.refresh(db_match)
+    match_cache.put(db_match)
     return db_match
 
 
@@ -64,6 +150,7 @@ def list_matches(
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
     sport: Optional[str] = None,
+    category: Optional[str] = None,
     only_open: bool = True,
     sido: Optional[str] = None,    # city/province
     gungu: Optional[str] = None,   # district/county
@@ -74,7 +161,8 @@ def list_matches(
 
     - ?date_param=2025-11-30 : specific date
     - ?from_date=...&to_date=... : date range filter
-    - ?sport=football : sport filter
+    - ?sport=basketball : sport filter (catalog code or name)
+    - ?category=pickup : category code filter
     - ?only_open=true : only OPEN status
     - ?sido=...&gungu=...&dong=... : location prefix filter (partial string)
     """
@@ -83,8 +171,22 @@ def list_matches(
     if only_open:
         query = query.filter(MatchModel.status == "OPEN")
 
-    if sport:
-        query = query.filter(MatchModel.sport == sport)
+    catalog = get_catalog(db)
+    sport_id = catalog.sport_id(sport)
+
+    if sport_id is not None:
+        query = query.filter(MatchModel.sport_id == sport_id)
+    elif sport:
+        # Not in the catalog: legacy free-string match
+        query = query.filter(MatchModel.sport == sport.strip())
+
+    if category:
+        if sport_id is not None:
+            category_id = catalog.category_id(sport_id, category)
+            category_ids = [category_id] if category_id is not None else []
+        else:
+            category_ids = catalog.category_ids(category)
+        query = query.filter(MatchModel.category_id.in_(category_ids))
 
     if date_param:
         query = query.filter(MatchModel.date == date_param)
@@ -120,8 +222,8 @@ def get_match(
     match_id: int,
     db: Session = Depends(get_db),
 ):
-    match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
-    if not match:
+    match = match_cache.get(db, match_id)
+    if match is None:
         raise HTTPException(status_code=404, detail="Match not found")
     return match
 
@@ -136,9 +238,7 @@ def update_match(
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
-    match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
-    if not match:
-        raise HTTPException(status_code=404, detail="Match not found")
+    match = get_match_or_404(db, match_id)
 
     if match.owner_id is not None and match.owner_id != current_user_id:
         raise HTTPException(status_code=403, detail="Not authorized to update this match.")
@@ -148,11 +248,42 @@ def update_match(
     else:
         update_data = match_in.dict(exclude_unset=True)
 
+    if "sport" in update_data or "category" in update_data:
+        sport = update_data.get("sport", match.sport)
+        category_sent = "category" in update_data
+        category = update_data.pop("category", None)
+        sport_id, category_id = resolve_sport(db, sport, category)
+
+        # Sport-only change: keep the category if it still belongs to that sport
+        if not category_sent:
+            if get_catalog(db).category_sport_id(match.category_id) == sport_id:
+                category_id = match.category_id
+
+        update_data["sport_id"], update_data["category_id"] = sport_id, category_id
+
+    previous_status = match.status
+    previous_placement = (match.location, match.date, match.start_time, match.end_time)
     for field, value in update_data.items():
         setattr(match, field, value)
 
+    # Re-check only when the booking actually moves or a cancelled match comes back;
+    # a plain status change, or resending the same time/place, must not trip over old overlaps
+    moved = (match.location, match.date, match.start_time, match.end_time) != previous_placement
+    reactivated = previous_status == "CANCELLED" and match.status != "CANCELLED"
+    if match.status != "CANCELLED" and (moved or reactivated):
+        with db.no_autoflush:
+            ensure_venue_free(
+                db,
+                match.location,
+                match.date,
+                match.start_time,
+                match.end_time,
+                exclude_match_id=match.id,
+            )
+
     db.commit()
     db.refresh(match)
+    match_cache.put(match)
     return match
 
 
@@ -165,15 +296,14 @@ def delete_match(
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
-    match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
-    if not match:
-        raise HTTPException(status_code=404, detail="Match not found")
+    match = get_match_or_404(db, match_id)
 
     if match.owner_id is not None and match.owner_id != current_user_id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this match.")
 
     db.delete(match)
     db.commit()
+    match_cache.invalidate(match_id)
     return
 
 
@@ -186,9 +316,7 @@ def cancel_match(
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
-    match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
-    if not match:
-        raise HTTPException(status_code=404, detail="Match not found")
+    match = get_match_or_404(db, match_id)
 
     if match.owner_id is not None and match.owner_id != current_user_id:
         raise HTTPException(status_code=403, detail="Not authorized to cancel this match.")
@@ -197,8 +325,20 @@ def cancel_match(
         return match
 
     match.status = "CANCELLED"
+
+    # Notify everyone still joined (delivered by the outbox dispatcher)
+    participant_ids = [
+        user_id
+        for (user_id,) in db.query(ParticipationModel.user_id).filter(
+            ParticipationModel.match_id == match_id,
+            ParticipationModel.status == "JOINED",
+        )
+    ]
+    enqueue_match_event(db, "MATCH_CANCELLED", match, current_user_id, participant_ids)
+
     db.commit()
     db.refresh(match)
+    match_cache.put(match)
     return match
 
 
@@ -212,9 +352,7 @@ def join_match(
     current_user_id: int = Depends(get_current_user_id),
 ):
     # Ensure match exists
-    match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
-    if not match:
-        raise HTTPException(status_code=404, detail="Match not found")
+    match = get_match_or_404(db, match_id)
 
     # Status check
     if match.status != "OPEN":
@@ -225,29 +363,32 @@ def join_match(
         raise HTTPException(status_code=400, detail="Match is full.")
 
     # Already joined?
-    existing = (
-        db.query(ParticipationModel)
-        .filter(
-            ParticipationModel.match_id == match_id,
-            ParticipationModel.user_id == current_user_id,
-            ParticipationModel.status == "JOINED",
-        )
-        .first()
-    )
-    if existing:
+    participation = get_participation(db, match_id, current_user_id)
+    if participation and participation.status == "JOINED":
         raise HTTPException(status_code=400, detail="Already joined this match.")
 
-    participation = ParticipationModel(
-        match_id=match_id,
-        user_id=current_user_id,
-        status="JOINED",
-    )
-    db.add(participation)
+    # Overlaps another match I already joined?
+    conflict = find_schedule_conflict(db, current_user_id, match)
+    if conflict:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Conflicts with joined match {conflict.id}.",
+        )
+
+    set_participation(db, match_id, current_user_id, "JOINED", participation)
 
     match.current_people += 1
 
-    db.commit()
+    enqueue_match_event(db, "MATCH_JOINED", match, current_user_id, [match.owner_id])
+
+    try:
+        db.commit()
+    except IntegrityError:
+        # Concurrent join by the same user hit the (match, user) unique key
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Already joined this match.")
     db.refresh(match)
+    match_cache.put(match)
     return match
 
 
@@ -260,30 +401,22 @@ def leave_match(
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
-    match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
-    if not match:
-        raise HTTPException(status_code=404, detail="Match not found")
+    match = get_match_or_404(db, match_id)
 
-    participation = (
-        db.query(ParticipationModel)
-        .filter(
-            ParticipationModel.match_id == match_id,
-            ParticipationModel.user_id == current_user_id,
-            ParticipationModel.status == "JOINED",
-        )
-        .first()
-    )
-
-    if not participation:
+    participation = get_participation(db, match_id, current_user_id)
+    if not participation or participation.status != "JOINED":
         raise HTTPException(status_code=400, detail="You are not joined in this match.")
 
-    participation.status = "CANCELLED"
+    set_participation(db, match_id, current_user_id, "CANCELLED", participation)
 
     if match.current_people > 0:
         match.current_people -= 1
 
+    enqueue_match_event(db, "MATCH_LEFT", match, current_user_id, [match.owner_id])
+
     db.commit()
     db.refresh(match)
+    match_cache.put(match)
     return match
 
 
@@ -1,43 +1,69 @@
 # backend/app/api/sports.py
 
-from fastapi import APIRouter, HTTPException
-
-router = APIRouter()
-
-SPORTS = [
-    {
-        "code": "basketball",
-        "name": "농구",
-        "status": "active",
-        "categories": [
-            {"code": "pickup", "name": "픽업게임"},
-            {"code": "scrimmage", "name": "연습게임"},
-            {"code": "guest", "name": "게스트 구인"},
-        ],
-    },
-    {
-        "code": "tennis",
-        "name": "테니스",
-        "status": "coming_soon",
-        "categories": [],
-    },
-    {
-        "code": "soccer",
-        "name": "축구",
-        "status": "coming_soon",
-        "categories": [],
-    },
-]
+from typing import Optional
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.orm import Session
 
+from ..core.config import ADMIN_USER_IDS
+from ..db.session import get_db
+from ..services.catalog import CachedJSON, get_catalog, reload_catalog
+from .matches import get_current_user_id
+
+router = APIRouter(prefix="/sports", tags=["sports"])
+
+
+def cached_response(cached: CachedJSON, if_none_match: Optional[str]) -> Response:
+    """
+    Serve pre-encoded JSON; 304 when the client already has this ETag.
+    """
+    headers = {"ETag": cached.etag}
+    if if_none_match == cached.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+# -------------------------------
+# 1. List sports - GET /sports/
+# -------------------------------
 @router.get("/")
-def list_sports():
-    return SPORTS
+def list_sports(
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    return cached_response(get_catalog(db).listing, if_none_match)
+
+
+# -------------------------------
+# 2. Reload catalog - POST /sports/reload
+# -------------------------------
+@router.post("/reload")
+def reload_sports(
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """
+    Re-read sports/categories tables without a restart.
+    - Admins only (ADMIN_USER_IDS)
+    - Bumps the stored catalog version; other workers reload on their next check
+    """
+    if current_user_id not in ADMIN_USER_IDS:
+        raise HTTPException(status_code=403, detail="Not authorized to reload sports.")
+
+    catalog = reload_catalog(db)
+    return {"etag": catalog.listing.etag}
 
 
+# -------------------------------
+# 3. Get a sport - GET /sports/{sport_code}
+# -------------------------------
 @router.get("/{sport_code}")
-def get_sport(sport_code: str):
-    for s in SPORTS:
-        if s["code"] == sport_code:
-            return s
-    raise HTTPException(status_code=404, detail="Sport not found")
+def get_sport(
+    sport_code: str,
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    cached = get_catalog(db).get_sport(sport_code)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Sport not found")
+    return cached_response(cached, if_none_match)
@@ -0,0 +1,38 @@
+# backend/app/api/venues.py
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from ..db.session import get_db
+from ..schemas import TimeSlot, VenueAvailability
+from ..services.booking import free_slots, venue_bookings
+
+router = APIRouter(prefix="/venues", tags=["venues"])
+
+
+# -------------------------------
+# 1. Venue availability - GET /venues/{location}/availability
+# -------------------------------
+@router.get("/{location}/availability", response_model=VenueAvailability)
+def get_venue_availability(
+    location: str,
+    date_param: date = Query(..., alias="date"),
+    db: Session = Depends(get_db),
+):
+    """
+    Busy/free time slots at a venue for one day
+
+    - ?date=2025-11-30 : day to inspect
+    - CANCELLED matches do not occupy the venue
+    """
+    bookings = venue_bookings(db, location, date_param)
+    busy, free = free_slots(bookings)
+
+    return VenueAvailability(
+        location=location,
+        date=date_param,
+        busy=[TimeSlot(start_time=s, end_time=e) for s, e in busy],
+        free=[TimeSlot(start_time=s, end_time=e) for s, e in free],
+    )
@@ -4,3 +4,35 @@ import os
 
 # 환경변수에 DATABASE_URL이 있으면 그걸 쓰고, 없으면 SQLite 파일 사용
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+
+# 관리용 API (예: POST /sports/reload) 를 호출할 수 있는 유저 ID 목록 (쉼표 구분). 비우면 아무도 못 씀
+ADMIN_USER_IDS = {
+    int(v) for v in os.getenv("ADMIN_USER_IDS", "").split(",") if v.strip()
+}
+
+# 종목 카탈로그 캐시: 이 간격(초)마다 DB 의 catalog_version 을 확인해서 다른 워커의 reload 를 반영
+CATALOG_CHECK_SECONDS = float(os.getenv("CATALOG_CHECK_SECONDS", "5"))
+
+# 종료 시간이 비어 있는 매칭은 시작 시간부터 이만큼(분) 장소를 점유한다고 간주
+DEFAULT_MATCH_DURATION_MINUTES = int(os.getenv("DEFAULT_MATCH_DURATION_MINUTES", "120"))
+
+# 워커 콜드 스타트(import + DB 초기화) 목표 시간(ms). 넘으면 경고 로그
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "1500"))
+
+# 알림 outbox 디스패처 설정
+OUTBOX_ENABLED = os.getenv("OUTBOX_ENABLED", "1") == "1"
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "200"))
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", "2"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+OUTBOX_RETRY_BASE_SECONDS = float(os.getenv("OUTBOX_RETRY_BASE_SECONDS", "5"))
+# 한 배치를 가져간 뒤 보내기까지 다른 디스패처가 건드리지 못하는 시간
+OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", "60"))
+# log (기본) 또는 file:<경로>  예) file:./notifications.jsonl
+OUTBOX_SINK = os.getenv("OUTBOX_SINK", "log")
+
+# 단건 매칭 조회 캐시 (프로세스 LRU + 공유 캐시)
+MATCH_CACHE_SIZE = int(os.getenv("MATCH_CACHE_SIZE", "1024"))
+MATCH_CACHE_TTL_SECONDS = float(os.getenv("MATCH_CACHE_TTL_SECONDS", "5"))
+MATCH_CACHE_SHARED_TTL_SECONDS = float(os.getenv("MATCH_CACHE_SHARED_TTL_SECONDS", "60"))
+# none (기본) 또는 local. local 은 프로세스마다 따로라 워커 간 공유가 안 됨 → 테스트/단일 워커용
+MATCH_CACHE_SHARED = os.getenv("MATCH_CACHE_SHARED", "none")
@@ -0,0 +1,83 @@
+# backend/app/core/startup.py
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from .config import STARTUP_BUDGET_MS
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    """
+    Cold-start timings for this worker process (milliseconds).
+
+    - import_ms: importing the app module (routers, models, schemas)
+    - db_init_ms: lifespan DB initialization
+    - first_request_ms: latency of the first request served
+    """
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, float] = {}
+        self.schema_ddl: Optional[bool] = None    # DDL 실행 여부 (fingerprint 불일치 시 True)
+
+    def record(self, name: str, started: float) -> None:
+        self.timings[f"{name}_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    @contextmanager
+    def measure(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    @property
+    def boot_ms(self) -> float:
+        return round(
+            self.timings.get("import_ms", 0.0) + self.timings.get("db_init_ms", 0.0), 2
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            **self.timings,
+            "boot_ms": self.boot_ms,
+            "budget_ms": STARTUP_BUDGET_MS,
+            "within_budget": self.boot_ms <= STARTUP_BUDGET_MS,
+            "schema_ddl": self.schema_ddl,
+        }
+
+    def log(self) -> None:
+        report = self.as_dict()
+        if report["within_budget"]:
+            logger.info("startup timings: %s", report)
+        else:
+            logger.warning("startup over budget: %s", report)
+
+
+startup_report = StartupReport()
+
+
+class FirstRequestTimer:
+    """
+    ASGI middleware that times the first HTTP request, then steps aside.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self.pending = True
+
+    async def __call__(self, scope, receive, send):
+        if not self.pending or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.pending = False
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            startup_report.record("first_request", started)
+            logger.info("first request: %s ms", startup_report.timings["first_request_ms"])
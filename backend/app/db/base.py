@@ -1,16 +1,147 @@
 # backend/app/db/base.py
 
+import hashlib
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, CreateTable
+
 from .session import engine
 from .base_class import Base
 
 # ⚠️ 여기서 모델을 import 해서 메타데이터에 등록
 from ..models.match import Match  # noqa
-from ..models.participation import Participation  # noqa
+from ..models.outbox import OutboxEvent  # noqa
+from ..models.participation import (  # noqa
+    Participation,
+    ParticipationEvent,
+    ParticipationEventRollup,
+)
+from ..models.sport import Sport, SportCategory  # noqa
+
+from .migrations import HEAD, run_migrations, schema_problems, set_meta
+from .seed import seed_sports
+
+# Postgres advisory lock 키 (스키마 초기화 전용, 아무 고정 정수)
+SCHEMA_LOCK_KEY = 720_029
+
+# 다른 워커가 스키마 작업 중일 때 기다리는 최대 시간(초)
+SCHEMA_LOCK_TIMEOUT_SECONDS = 120
+
+
+class SchemaMismatchError(RuntimeError):
+    """DB 스키마가 모델과 다르고 마이그레이션으로도 맞출 수 없음."""
+
+
+def schema_fingerprint(bind=engine) -> str:
+    """
+    현재 모델 메타데이터로 만든 DDL + 마이그레이션 버전의 해시.
+    모델(테이블/컬럼/인덱스)이나 마이그레이션 단계가 바뀌면 값이 달라진다.
+    """
+    ddl = [f"migrations:{HEAD}"]
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=bind.dialect)))
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=bind.dialect)))
+    return hashlib.sha256("\n".join(ddl).encode("utf-8")).hexdigest()
+
+
+def stored_fingerprint(conn: Connection) -> Optional[str]:
+    if not inspect(conn).has_table("schema_meta"):
+        return None
+    return conn.execute(
+        text("SELECT value FROM schema_meta WHERE key = 'fingerprint'")
+    ).scalar()
+
+
+@contextmanager
+def schema_lock(bind):
+    """
+    스키마 작업 전체를 감싸는 DB 수준 lock + 트랜잭션.
+    - SQLite: BEGIN IMMEDIATE (쓰기 lock 을 트랜잭션 시작 시점에 잡음)
+    - Postgres: pg_advisory_xact_lock (커밋/롤백 때 자동 해제)
+    여러 워커가 동시에 떠도 한 워커만 DDL 을 실행한다.
+    """
+    with bind.connect() as conn:
+        if conn.dialect.name != "sqlite":
+            with conn.begin():
+                if conn.dialect.name == "postgresql":
+                    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+                yield conn
+            return
+
+        # pysqlite 가 알아서 BEGIN 하지 않게 하고 직접 BEGIN IMMEDIATE.
+        # 이후 SQLAlchemy 의 commit/rollback 이 이 트랜잭션을 끝낸다.
+        dbapi_conn = conn.connection.driver_connection
+        saved = dbapi_conn.isolation_level
+        dbapi_conn.isolation_level = None
+        try:
+            with conn.begin():
+                deadline = time.monotonic() + SCHEMA_LOCK_TIMEOUT_SECONDS
+                while True:
+                    try:
+                        conn.exec_driver_sql("BEGIN IMMEDIATE")
+                        break
+                    except OperationalError as exc:
+                        if "locked" not in str(exc) or time.monotonic() > deadline:
+                            raise
+                        time.sleep(0.05)
+                yield conn
+        finally:
+            dbapi_conn.isolation_level = saved
 
 
-def init_db():
+def init_db(bind=engine) -> bool:
     """
     애플리케이션 시작 시 한 번 호출해서
-    모든 테이블을 생성하는 함수.
+    테이블 생성 + 마이그레이션 + 기본 종목 데이터를 넣는 함수.
+
+    저장된 schema fingerprint 가 지금 모델과 같으면 전부 건너뛴다
+    (테이블마다 reflection 하지 않고 쿼리 한 번으로 끝남).
+    다르면 schema_lock 을 잡고 fingerprint 를 다시 확인한 뒤,
+    한 트랜잭션 안에서 전부 적용한다 → 먼저 lock 을 잡은 워커만 DDL 실행.
+    적용 후 실제 스키마가 모델과 다르면 롤백하고 SchemaMismatchError.
+    DDL 을 실행했으면 True.
     """
-    Base.metadata.create_all(bind=engine)
+    fingerprint = schema_fingerprint(bind)
+
+    with bind.connect() as conn:
+        if stored_fingerprint(conn) == fingerprint:
+            return False
+
+    with schema_lock(bind) as conn:
+        if stored_fingerprint(conn) == fingerprint:
+            return False  # 기다리는 동안 다른 워커가 끝냄
+
+        conn.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS schema_meta "
+                "(key VARCHAR PRIMARY KEY, value VARCHAR NOT NULL)"
+            )
+        )
+
+        # 1) 없는 테이블 생성  2) 기본 종목 (백필 단계가 참조)  3) 기존 테이블 변경
+        Base.metadata.create_all(bind=conn)
+
+        db = Session(bind=conn)
+        try:
+            seed_sports(db)
+        finally:
+            db.close()
+
+        run_migrations(conn)
+
+        problems = schema_problems(conn)
+        if problems:
+            raise SchemaMismatchError(
+                "DB schema does not match the models after migrations: " + "; ".join(problems)
+            )
+
+        set_meta(conn, "fingerprint", fingerprint)
+
+    return True
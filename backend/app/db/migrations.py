@@ -0,0 +1,227 @@
+# backend/app/db/migrations.py
+
+from typing import Callable, List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+from .base_class import Base
+
+# ⚠️ create_all 은 "없는 테이블"만 만든다.
+#    이미 있는 테이블에 컬럼/인덱스를 추가하는 변경은 반드시 여기 단계로 추가할 것.
+#    각 단계는 이미 적용된 DB(새로 create_all 한 DB 포함)에서 다시 돌아도 안전해야 함.
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def _column_type(conn: Connection, table: str, column: str) -> str:
+    """모델에 정의된 컬럼 타입을 이 DB 방언의 DDL 로 (예: Postgres 는 TIMESTAMP WITH TIME ZONE)."""
+    return Base.metadata.tables[table].c[column].type.compile(dialect=conn.dialect)
+
+
+def _create_index(
+    conn: Connection,
+    name: str,
+    table: str,
+    columns: List[str],
+    unique: bool = False,
+) -> None:
+    conn.execute(
+        text(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS "
+            f"{name} ON {table} ({', '.join(columns)})"
+        )
+    )
+
+
+# -------------------------------
+# 1. 장소 중복 예약 검사용 인덱스
+# -------------------------------
+def _matches_location_index(conn: Connection) -> None:
+    _create_index(
+        conn,
+        "ix_matches_location_date_start",
+        "matches",
+        ["location", "date", "start_time"],
+    )
+
+
+# -------------------------------
+# 2. 종목 카탈로그 참조 컬럼 + 기존 sport 문자열 백필
+# -------------------------------
+def _matches_sport_ids(conn: Connection) -> None:
+    if not _has_column(conn, "matches", "sport_id"):
+        conn.execute(text("ALTER TABLE matches ADD COLUMN sport_id INTEGER REFERENCES sports (id)"))
+    if not _has_column(conn, "matches", "category_id"):
+        conn.execute(
+            text("ALTER TABLE matches ADD COLUMN category_id INTEGER REFERENCES sport_categories (id)")
+        )
+    _create_index(
+        conn,
+        "ix_matches_sport_category_date",
+        "matches",
+        ["sport_id", "category_id", "date"],
+    )
+
+    # 카탈로그와 같은 규칙: code 또는 표시 이름, 앞뒤 공백/대소문자 무시
+    conn.execute(
+        text(
+            "UPDATE matches SET sport_id = ("
+            "  SELECT s.id FROM sports s"
+            "  WHERE lower(s.code) = lower(trim(matches.sport))"
+            "     OR lower(s.name) = lower(trim(matches.sport))"
+            "  ORDER BY s.id LIMIT 1"
+            ") "
+            "WHERE sport_id IS NULL AND sport IS NOT NULL"
+        )
+    )
+
+
+# -------------------------------
+# 3. 참여: (매칭, 유저) 당 한 줄로 합치고 unique 인덱스
+# -------------------------------
+def _participations_current_state(conn: Connection) -> None:
+    if not _has_column(conn, "participations", "updated_at"):
+        # SQLite 는 ADD COLUMN 에 CURRENT_TIMESTAMP 기본값을 못 씀 → 추가 후 채움
+        updated_at = _column_type(conn, "participations", "updated_at")
+        conn.execute(text(f"ALTER TABLE participations ADD COLUMN updated_at {updated_at}"))
+        conn.execute(text("UPDATE participations SET updated_at = created_at"))
+
+    # 가장 최근 줄(id 가 가장 큰 줄)이 현재 상태
+    conn.execute(
+        text(
+            "DELETE FROM participations WHERE id NOT IN ("
+            "  SELECT MAX(id) FROM participations GROUP BY match_id, user_id"
+            ")"
+        )
+    )
+    _create_index(
+        conn,
+        "uq_participations_match_user",
+        "participations",
+        ["match_id", "user_id"],
+        unique=True,
+    )
+    _create_index(conn, "ix_participations_user_status", "participations", ["user_id", "status"])
+
+    # 중복 JOINED 로 부풀려졌을 수 있는 인원 다시 계산
+    conn.execute(
+        text(
+            "UPDATE matches SET current_people = ("
+            "  SELECT COUNT(*) FROM participations p"
+            "  WHERE p.match_id = matches.id AND p.status = 'JOINED'"
+            ")"
+        )
+    )
+
+
+# -------------------------------
+# 4. outbox 배치 lease 컬럼
+# -------------------------------
+def _outbox_claims(conn: Connection) -> None:
+    if not _has_column(conn, "outbox_events", "claimed_by"):
+        conn.execute(text("ALTER TABLE outbox_events ADD COLUMN claimed_by VARCHAR"))
+    if not _has_column(conn, "outbox_events", "claimed_until"):
+        claimed_until = _column_type(conn, "outbox_events", "claimed_until")
+        conn.execute(text(f"ALTER TABLE outbox_events ADD COLUMN claimed_until {claimed_until}"))
+
+
+# -------------------------------
+# 5. 매칭 버전 컬럼 (캐시 일관성)
+# -------------------------------
+def _matches_version(conn: Connection) -> None:
+    if not _has_column(conn, "matches", "version"):
+        conn.execute(text("ALTER TABLE matches ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+
+# -------------------------------
+# 6. 종목 카탈로그 버전 (워커 간 캐시 갱신 신호)
+# -------------------------------
+def _catalog_version(conn: Connection) -> None:
+    conn.execute(
+        text(
+            "INSERT INTO schema_meta (key, value) "
+            "SELECT 'catalog_version', '1' "
+            "WHERE NOT EXISTS (SELECT 1 FROM schema_meta WHERE key = 'catalog_version')"
+        )
+    )
+
+
+# -------------------------------
+# 7. 참여: 단독 match_id / user_id 인덱스 제거
+#    (uq_participations_match_user, ix_participations_user_status 가 대신함)
+# -------------------------------
+def _participations_drop_single_indexes(conn: Connection) -> None:
+    conn.execute(text("DROP INDEX IF EXISTS ix_participations_match_id"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_participations_user_id"))
+
+
+MIGRATIONS: List[Tuple[str, Callable[[Connection], None]]] = [
+    ("matches (location, date, start_time) index", _matches_location_index),
+    ("matches.sport_id / category_id + backfill", _matches_sport_ids),
+    ("participations one row per (match, user)", _participations_current_state),
+    ("outbox_events lease columns", _outbox_claims),
+    ("matches.version", _matches_version),
+    ("schema_meta catalog_version", _catalog_version),
+    ("participations drop single-column indexes", _participations_drop_single_indexes),
+]
+
+HEAD = len(MIGRATIONS)
+
+
+def get_version(conn: Connection) -> int:
+    value = conn.execute(
+        text("SELECT value FROM schema_meta WHERE key = 'version'")
+    ).scalar()
+    return int(value) if value is not None else 0
+
+
+def set_meta(conn: Connection, key: str, value: str) -> None:
+    conn.execute(text("DELETE FROM schema_meta WHERE key = :key"), {"key": key})
+    conn.execute(
+        text("INSERT INTO schema_meta (key, value) VALUES (:key, :value)"),
+        {"key": key, "value": value},
+    )
+
+
+def run_migrations(conn: Connection) -> int:
+    """
+    저장된 version 이후 단계를 순서대로 적용.
+    호출한 쪽의 트랜잭션(스키마 lock 을 잡은 연결) 안에서 돈다.
+    적용한 단계 수를 돌려준다.
+    """
+    version = get_version(conn)
+
+    applied = 0
+    for number, (description, step) in enumerate(MIGRATIONS, start=1):
+        if number <= version:
+            continue
+        step(conn)
+        set_meta(conn, "version", str(number))
+        applied += 1
+    return applied
+
+
+def schema_problems(bind) -> List[str]:
+    """
+    모델 메타데이터와 실제 DB 비교: 빠진 테이블/컬럼/인덱스 목록.
+    """
+    insp = inspect(bind)
+    problems = []
+    for table in Base.metadata.sorted_tables:
+        if not insp.has_table(table.name):
+            problems.append(f"missing table {table.name}")
+            continue
+
+        columns = {c["name"] for c in insp.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in columns:
+                problems.append(f"missing column {table.name}.{column.name}")
+
+        indexes = {i["name"] for i in insp.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in indexes:
+                problems.append(f"missing index {index.name} on {table.name}")
+    return problems
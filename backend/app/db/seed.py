@@ -0,0 +1,62 @@
+# backend/app/db/seed.py
+
+from sqlalchemy.orm import Session
+
+from ..models.sport import Sport, SportCategory
+
+# 🔹 sports 테이블이 비어 있을 때 한 번만 넣는 기본 종목 데이터
+SPORTS = [
+    {
+        "code": "basketball",
+        "name": "농구",
+        "status": "active",
+        "categories": [
+            {"code": "pickup", "name": "픽업게임"},
+            {"code": "scrimmage", "name": "연습게임"},
+            {"code": "guest", "name": "게스트 구인"},
+        ],
+    },
+    {
+        "code": "tennis",
+        "name": "테니스",
+        "status": "coming_soon",
+        "categories": [],
+    },
+    {
+        "code": "soccer",
+        "name": "축구",
+        "status": "coming_soon",
+        "categories": [],
+    },
+]
+
+
+def seed_sports(db: Session) -> None:
+    """
+    종목 테이블이 비어 있으면 SPORTS 를 넣는다.
+    이미 데이터가 있으면 건드리지 않음 (운영 중 수정한 값 보존).
+    """
+    if db.query(Sport.id).first() is not None:
+        return
+
+    for order, s in enumerate(SPORTS):
+        sport = Sport(
+            code=s["code"],
+            name=s["name"],
+            status=s["status"],
+            sort_order=order,
+        )
+        db.add(sport)
+        db.flush()
+
+        for c_order, c in enumerate(s["categories"]):
+            db.add(
+                SportCategory(
+                    sport_id=sport.id,
+                    code=c["code"],
+                    name=c["name"],
+                    sort_order=c_order,
+                )
+            )
+
+    db.commit()
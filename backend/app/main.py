@@ -1,13 +1,47 @@
 # backend/app/main.py
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import time
+
+_import_started = time.perf_counter()
+
+from contextlib import asynccontextmanager  # noqa: E402
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+
+from .api import matches as matches_router  # noqa: E402
+from .api import sports as sports_router  # noqa: E402
+from .api import venues as venues_router  # noqa: E402
+from .core.config import OUTBOX_ENABLED  # noqa: E402
+from .core.startup import FirstRequestTimer, startup_report  # noqa: E402
+from .db.base import init_db  # noqa: E402
+from .services.match_cache import match_cache  # noqa: E402
+from .services.notifications import get_sink  # noqa: E402
+from .services.outbox import OutboxDispatcher  # noqa: E402
+
+
+# ✅ 서버 시작할 때 DB 초기화 (스키마가 그대로면 DDL 생략)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    with startup_report.measure("db_init"):
+        startup_report.schema_ddl = init_db()
+    startup_report.log()
+
+    # 🔔 알림 outbox 디스패처 (백그라운드에서 배치 발송)
+    dispatcher = None
+    if OUTBOX_ENABLED:
+        dispatcher = OutboxDispatcher(get_sink())
+        dispatcher.start()
+
+    yield
+
+    if dispatcher is not None:
+        await dispatcher.stop()
 
-from .api import matches as matches_router
-from .db.base import init_db       # 🔹 DB 초기화 함수 가져오기
 
 app = FastAPI(
     title="FitMatch Backend",
     version="0.2.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정 (지금은 개발 편하라고 전체 허용)
@@ -24,17 +58,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 첫 요청 지연 시간 측정 (가장 바깥에서 측정되도록 마지막에 추가)
+app.add_middleware(FirstRequestTimer)
+
 
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
 
 
+# 콜드 스타트 측정 결과 (import / DB 초기화 / 첫 요청)
+@app.get("/health/startup")
+def startup_timings():
+    return startup_report.as_dict()
+
+
+# 단건 매칭 캐시 적중률 / stale 통계 (이 워커 기준)
+@app.get("/health/match-cache")
+def match_cache_stats():
+    return match_cache.stats_dict()
+
+
 # 라우터 등록
 app.include_router(matches_router.router)
+app.include_router(sports_router.router)
+app.include_router(venues_router.router)
 
-
-# ✅ 서버 시작할 때 DB 테이블 자동 생성
-@app.on_event("startup")
-def on_startup():
-    init_db()
+startup_report.record("import", _import_started)
@@ -1,2 +1,4 @@
 # backend/app/models/__init__.py
 from .match import Match  # noqa: F401
+from .sport import Sport, SportCategory  # noqa: F401
+from .outbox import OutboxEvent  # noqa: F401
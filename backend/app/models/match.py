@@ -7,14 +7,22 @@ from sqlalchemy import (
     Date,
     Time,
     DateTime,
+    Index,
+    ForeignKey,
 )
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from ..db.base_class import Base
 
 
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        # 🔹 장소 중복 예약 검사용: (장소, 날짜) 로 찾고 시작 시간 순으로 훑는다
+        Index("ix_matches_location_date_start", "location", "date", "start_time"),
+        # 🔹 종목/카테고리 필터용 (정수 비교)
+        Index("ix_matches_sport_category_date", "sport_id", "category_id", "date"),
+    )
 
     # 🔹 기본 키
     id = Column(Integer, primary_key=True, index=True)
@@ -23,6 +31,10 @@ class Match(Base):
     title = Column(String, nullable=False)          # 매칭 제목
     description = Column(String, nullable=True)     # 설명
     sport = Column(String, nullable=True)           # 종목명 (예: 농구, 풋살) - 선택
+
+    # 🔹 종목 카탈로그 참조 (sport 문자열을 카탈로그에서 찾으면 채워짐)
+    sport_id = Column(Integer, ForeignKey("sports.id"), nullable=True)
+    category_id = Column(Integer, ForeignKey("sport_categories.id"), nullable=True)
     location = Column(String, nullable=False)       # 장소
 
     date = Column(Date, nullable=False)             # 날짜 (예: 2025-11-30)
@@ -62,3 +74,13 @@ class Match(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    # 🔹 수정할 때마다 DB 에서 1씩 증가하는 버전 (캐시 일관성 확인용)
+    #    updated_at 은 SQLite 에서 초 단위라 같은 초의 두 수정을 구분 못 함
+    version = Column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default=text("1"),
+        onupdate=text("version + 1"),
+    )
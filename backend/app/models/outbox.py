@@ -0,0 +1,51 @@
+# backend/app/models/outbox.py
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+
+from ..db.base_class import Base
+
+
+class OutboxEvent(Base):
+    """
+    보낼 알림 한 건 (수신자 한 명 기준).
+    쓰기 API 와 같은 트랜잭션에서 쌓이고, 디스패처가 배치로 꺼내서 보낸다.
+    """
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # 디스패처가 보낼 차례인 PENDING 만 훑도록
+        Index("ix_outbox_events_status_next", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # MATCH_JOINED / MATCH_LEFT / MATCH_CANCELLED
+    event_type = Column(String, nullable=False)
+
+    match_id = Column(Integer, nullable=False)      # 매칭이 삭제돼도 알림은 남도록 FK 없음
+    actor_id = Column(Integer, nullable=True)       # 이벤트를 일으킨 유저
+    recipient_id = Column(Integer, nullable=False)  # 알림 받을 유저
+
+    payload = Column(Text, nullable=True)           # JSON 문자열 (매칭 제목 등)
+
+    # PENDING / SENT / FAILED
+    status = Column(String, nullable=False, default="PENDING")
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=True)
+
+    # 디스패처가 가져간 표시 (lease). claimed_until 이 지나면 다른 디스패처가 다시 가져갈 수 있음
+    claimed_by = Column(String, nullable=True)
+    claimed_until = Column(DateTime(timezone=True), nullable=True)
+
+    next_attempt_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    sent_at = Column(DateTime(timezone=True), nullable=True)
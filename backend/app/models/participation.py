@@ -1,6 +1,15 @@
 # backend/app/models/participation.py
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.sql import func
 
 from ..db.base_class import Base
@@ -8,6 +17,15 @@ from ..db.base_class import Base
 
 class Participation(Base):
     __tablename__ = "participations"
+    __table_args__ = (
+        # (매칭, 유저) 당 현재 상태 한 줄만 유지 → join/leave 는 이 줄을 upsert
+        # (기존 테이블에도 마이그레이션으로 붙일 수 있게 제약 대신 unique 인덱스)
+        Index("uq_participations_match_user", "match_id", "user_id", unique=True),
+        # 내가 참여한 매칭 목록 조회용
+        Index("ix_participations_user_status", "user_id", "status"),
+        # match_id / user_id 단독 인덱스는 두지 않음: 위 두 인덱스의 앞 컬럼이 대신함
+
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -16,13 +34,12 @@ class Participation(Base):
         Integer,
         ForeignKey("matches.id", ondelete="CASCADE"),  # 매칭 삭제 시 참여도 같이 삭제
         nullable=False,
-        index=True,
     )
 
     # 누가 참여했는지 (지금은 User 테이블이 없으므로 단순 int로)
-    user_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=False)
 
-    # 상태: JOINED / CANCELLED 등
+    # 현재 상태: JOINED / CANCELLED
     status = Column(String, nullable=False, default="JOINED")
 
     created_at = Column(
@@ -30,3 +47,61 @@ class Participation(Base):
         server_default=func.now(),
         nullable=False,
     )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class ParticipationEvent(Base):
+    """
+    참여/취소 이력 (append-only).
+    오래된 이벤트는 compact_participation_events 로 일별 집계 후 삭제.
+    """
+
+    __tablename__ = "participation_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    match_id = Column(
+        Integer,
+        ForeignKey("matches.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id = Column(Integer, nullable=False)
+
+    # JOIN / LEAVE
+    action = Column(String, nullable=False)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+
+class ParticipationEventRollup(Base):
+    """
+    (매칭, 날짜) 별 JOIN/LEAVE 횟수 집계.
+    """
+
+    __tablename__ = "participation_event_rollups"
+    __table_args__ = (
+        UniqueConstraint("match_id", "day", name="uq_participation_event_rollups_match_day"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    match_id = Column(
+        Integer,
+        ForeignKey("matches.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    day = Column(Date, nullable=False)
+
+    joins = Column(Integer, nullable=False, default=0)
+    leaves = Column(Integer, nullable=False, default=0)
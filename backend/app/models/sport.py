@@ -0,0 +1,41 @@
+# backend/app/models/sport.py
+
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
+
+from ..db.base_class import Base
+
+
+class Sport(Base):
+    __tablename__ = "sports"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    code = Column(String, nullable=False, unique=True)    # 예: basketball
+    name = Column(String, nullable=False)                 # 표시 이름 (예: 농구)
+
+    # active / coming_soon
+    status = Column(String, nullable=False, default="active")
+
+    # 목록 노출 순서
+    sort_order = Column(Integer, nullable=False, default=0)
+
+
+class SportCategory(Base):
+    __tablename__ = "sport_categories"
+    __table_args__ = (
+        UniqueConstraint("sport_id", "code", name="uq_sport_categories_sport_code"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    sport_id = Column(
+        Integer,
+        ForeignKey("sports.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    code = Column(String, nullable=False)                 # 예: pickup
+    name = Column(String, nullable=False)                 # 예: 픽업게임
+
+    sort_order = Column(Integer, nullable=False, default=0)
@@ -12,3 +12,8 @@ from .participation import (
     ParticipationBase,
     ParticipationCreate,
 )
+
+from .venue import (
+    TimeSlot,
+    VenueAvailability,
+)
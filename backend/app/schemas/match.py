@@ -1,6 +1,7 @@
 # backend/app/schemas/match.py
 
 from datetime import date, time, datetime
+from datetime import date as DateType
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -22,9 +23,8 @@ class MatchBase(BaseModel):
 
 # 🔹 생성용: POST /matches 에서 사용하는 요청 바디
 class MatchCreate(MatchBase):
-    # 지금은 MatchBase와 완전히 동일하지만,
-    # 나중에 "생성 시에만 필요한 필드"가 있으면 여기에 추가하면 됨.
-    pass
+    # 종목 카테고리 코드 (예: pickup) - sport 가 카탈로그에 있을 때만 의미 있음
+    category: Optional[str] = None
 
 
 # 🔹 수정용: PUT/PATCH /matches/{id} 에서 사용하는 요청 바디
@@ -34,9 +34,11 @@ class MatchUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     sport: Optional[str] = None
+    category: Optional[str] = None
     location: Optional[str] = None
 
-    date: Optional[date] = None
+    # 필드 이름이 date 라서 기본값(None)이 먼저 바인딩됨 → 타입은 별칭으로
+    date: Optional[DateType] = None
     start_time: Optional[time] = None
     end_time: Optional[time] = None
 
@@ -53,8 +55,12 @@ class Match(MatchBase):
     status: str                          # OPEN / CLOSED / CANCELLED
     current_people: int                  # 현재 참여 인원
 
+    sport_id: Optional[int] = None       # 종목 카탈로그 ID
+    category_id: Optional[int] = None    # 카테고리 ID
+
     created_at: datetime                 # 생성 시각
     updated_at: datetime                 # 마지막 수정 시각
+    version: int = 1                     # 수정할 때마다 1씩 증가
 
     # SQLAlchemy 모델에서 바로 응답 모델로 변환할 수 있게 하는 설정
     # (Pydantic v1의 orm_mode=True 와 같은 역할)
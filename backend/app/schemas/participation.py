@@ -20,6 +20,7 @@ class Participation(ParticipationBase):
     id: int
     status: str
     created_at: datetime
+    updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,20 @@
+# backend/app/schemas/venue.py
+
+from datetime import date, time
+from typing import List
+
+from pydantic import BaseModel
+
+
+# 🔹 하루 중 한 구간 [start_time, end_time)
+class TimeSlot(BaseModel):
+    start_time: time
+    end_time: time
+
+
+# 🔹 GET /venues/{location}/availability 응답
+class VenueAvailability(BaseModel):
+    location: str
+    date: date
+    busy: List[TimeSlot]                 # 이미 예약된 구간 (겹치는 매칭은 합쳐서)
+    free: List[TimeSlot]                 # 비어 있는 구간
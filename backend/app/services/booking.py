@@ -0,0 +1,145 @@
+# backend/app/services/booking.py
+
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..core.config import DEFAULT_MATCH_DURATION_MINUTES
+from ..models.match import Match as MatchModel
+from ..models.participation import Participation as ParticipationModel
+
+Interval = Tuple[time, time]
+
+DAY_START = time.min
+DAY_END = time.max
+
+
+def match_interval(start_time: time, end_time: Optional[time]) -> Interval:
+    """
+    (start, end) half-open interval a match occupies on its date.
+    - Missing end_time: DEFAULT_MATCH_DURATION_MINUTES from start
+    - Intervals are clipped to the end of the day
+    """
+    if end_time is None:
+        end_dt = datetime.combine(date.min, start_time) + timedelta(
+            minutes=DEFAULT_MATCH_DURATION_MINUTES
+        )
+        if end_dt.date() != date.min:
+            return start_time, DAY_END
+        return start_time, end_dt.time()
+
+    # Crosses midnight: occupy the rest of the day
+    if end_time <= start_time:
+        return start_time, DAY_END
+
+    return start_time, end_time
+
+
+def overlaps(a: Interval, b: Interval) -> bool:
+    return a[0] < b[1] and b[0] < a[1]
+
+
+def venue_bookings(
+    db: Session,
+    location: str,
+    on_date: date,
+    exclude_match_id: Optional[int] = None,
+) -> List[MatchModel]:
+    """
+    Active (non-cancelled) matches at a venue on a date, ordered by start_time.
+    Served by the (location, date, start_time) index.
+    """
+    query = db.query(MatchModel).filter(
+        MatchModel.location == location,
+        MatchModel.date == on_date,
+        MatchModel.status != "CANCELLED",
+    )
+    if exclude_match_id is not None:
+        query = query.filter(MatchModel.id != exclude_match_id)
+    return query.order_by(MatchModel.start_time, MatchModel.id).all()
+
+
+def first_conflict(
+    candidates: Iterable[MatchModel],
+    start_time: time,
+    end_time: Optional[time],
+) -> Optional[MatchModel]:
+    wanted = match_interval(start_time, end_time)
+    for other in candidates:
+        if overlaps(wanted, match_interval(other.start_time, other.end_time)):
+            return other
+    return None
+
+
+def find_venue_conflict(
+    db: Session,
+    location: str,
+    on_date: date,
+    start_time: time,
+    end_time: Optional[time],
+    exclude_match_id: Optional[int] = None,
+) -> Optional[MatchModel]:
+    bookings = venue_bookings(db, location, on_date, exclude_match_id)
+    return first_conflict(bookings, start_time, end_time)
+
+
+def find_schedule_conflict(
+    db: Session,
+    user_id: int,
+    match: MatchModel,
+) -> Optional[MatchModel]:
+    """
+    A match the user has already JOINED that overlaps `match` in time.
+    """
+    joined = (
+        db.query(MatchModel)
+        .join(
+            ParticipationModel,
+            ParticipationModel.match_id == MatchModel.id,
+        )
+        .filter(
+            ParticipationModel.user_id == user_id,
+            ParticipationModel.status == "JOINED",
+            MatchModel.date == match.date,
+            MatchModel.status != "CANCELLED",
+            MatchModel.id != match.id,
+        )
+        .order_by(MatchModel.start_time, MatchModel.id)
+        .all()
+    )
+    return first_conflict(joined, match.start_time, match.end_time)
+
+
+def free_slots(
+    bookings: Iterable[MatchModel],
+    day_start: time = DAY_START,
+    day_end: time = DAY_END,
+) -> Tuple[List[Interval], List[Interval]]:
+    """
+    Single pass over bookings sorted by start_time.
+    Returns (busy, free) where busy intervals are merged.
+    """
+    busy: List[Interval] = []
+    for booking in bookings:
+        start, end = match_interval(booking.start_time, booking.end_time)
+        if busy and start <= busy[-1][1]:
+            if end > busy[-1][1]:
+                busy[-1] = (busy[-1][0], end)
+        else:
+            busy.append((start, end))
+
+    free: List[Interval] = []
+    cursor = day_start
+    for start, end in busy:
+        if end <= cursor:
+            continue
+        if start > cursor:
+            free.append((cursor, min(start, day_end)))
+        cursor = max(cursor, end)
+        if cursor >= day_end:
+            break
+    if cursor < day_end:
+        free.append((cursor, day_end))
+
+    return busy, free
@@ -0,0 +1,167 @@
+# backend/app/services/catalog.py
+
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..core.config import CATALOG_CHECK_SECONDS
+from ..models.sport import Sport, SportCategory
+
+
+class CachedJSON:
+    """
+    Pre-encoded JSON body with its ETag.
+    """
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, payload) -> None:
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+
+
+class SportCatalog:
+    """
+    Immutable snapshot of the sports/categories tables.
+
+    - Listing and per-sport responses are encoded once at load time
+    - Lookups by code/name/category are dict hits
+    """
+
+    def __init__(self, sports: List[Sport], categories: List[SportCategory]) -> None:
+        by_sport: Dict[int, List[SportCategory]] = {}
+        for c in categories:
+            by_sport.setdefault(c.sport_id, []).append(c)
+
+        self._sport_ids: Dict[str, int] = {}
+        self._category_ids: Dict[Tuple[int, str], int] = {}
+        self._category_ids_by_code: Dict[str, List[int]] = {}
+        self._category_sport: Dict[int, int] = {}
+        self._sports: Dict[str, CachedJSON] = {}
+
+        payload = []
+        for s in sports:
+            cats = by_sport.get(s.id, [])
+            item = {
+                "id": s.id,
+                "code": s.code,
+                "name": s.name,
+                "status": s.status,
+                "categories": [
+                    {"id": c.id, "code": c.code, "name": c.name} for c in cats
+                ],
+            }
+            payload.append(item)
+            self._sports[s.code] = CachedJSON(item)
+
+            # code / 표시 이름 둘 다로 찾을 수 있게 (대소문자, 공백 무시)
+            self._sport_ids[_normalize(s.code)] = s.id
+            self._sport_ids[_normalize(s.name)] = s.id
+            for c in cats:
+                self._category_ids[(s.id, _normalize(c.code))] = c.id
+                self._category_ids_by_code.setdefault(_normalize(c.code), []).append(c.id)
+                self._category_sport[c.id] = s.id
+
+        self.listing = CachedJSON(payload)
+
+    def get_sport(self, code: str) -> Optional[CachedJSON]:
+        return self._sports.get(code)
+
+    def sport_id(self, sport: Optional[str]) -> Optional[int]:
+        if not sport:
+            return None
+        return self._sport_ids.get(_normalize(sport))
+
+    def category_id(self, sport_id: int, category: str) -> Optional[int]:
+        return self._category_ids.get((sport_id, _normalize(category)))
+
+    def category_sport_id(self, category_id: Optional[int]) -> Optional[int]:
+        """Sport a category belongs to."""
+        if category_id is None:
+            return None
+        return self._category_sport.get(category_id)
+
+    def category_ids(self, category: str) -> List[int]:
+        """Category ids with this code across all sports."""
+        return self._category_ids_by_code.get(_normalize(category), [])
+
+
+def _normalize(value: str) -> str:
+    return value.strip().lower()
+
+
+def load_catalog(db: Session) -> SportCatalog:
+    sports = db.query(Sport).order_by(Sport.sort_order, Sport.id).all()
+    categories = (
+        db.query(SportCategory)
+        .order_by(SportCategory.sort_order, SportCategory.id)
+        .all()
+    )
+    return SportCatalog(sports, categories)
+
+
+# -------------------------------
+# Process-level cache
+# -------------------------------
+_catalog: Optional[SportCatalog] = None
+_catalog_version: Optional[str] = None   # schema_meta.catalog_version the cache was built from
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def stored_version(db: Session) -> Optional[str]:
+    return db.execute(
+        text("SELECT value FROM schema_meta WHERE key = 'catalog_version'")
+    ).scalar()
+
+
+def get_catalog(db: Session) -> SportCatalog:
+    """
+    Cached catalog; loaded from the DB on first use.
+    At most every CATALOG_CHECK_SECONDS the stored catalog_version is read
+    (one primary-key lookup) and the catalog is rebuilt if another worker
+    bumped it.
+    """
+    global _checked_at
+    catalog = _catalog
+    if catalog is not None and time.monotonic() - _checked_at < CATALOG_CHECK_SECONDS:
+        return catalog
+
+    version = stored_version(db)
+    with _lock:
+        if _catalog is None or version != _catalog_version:
+            _swap(load_catalog(db), version)
+        _checked_at = time.monotonic()
+        return _catalog
+
+
+def reload_catalog(db: Session) -> SportCatalog:
+    """
+    Rebuild the catalog from the DB and bump catalog_version, so every
+    other worker reloads within CATALOG_CHECK_SECONDS.
+    """
+    global _checked_at
+    db.execute(
+        text(
+            "UPDATE schema_meta SET value = CAST(CAST(value AS INTEGER) + 1 AS VARCHAR) "
+            "WHERE key = 'catalog_version'"
+        )
+    )
+    db.commit()
+
+    version = stored_version(db)
+    with _lock:
+        _swap(load_catalog(db), version)
+        _checked_at = time.monotonic()
+        return _catalog
+
+
+def _swap(catalog: SportCatalog, version: Optional[str]) -> None:
+    global _catalog, _catalog_version
+    _catalog = catalog
+    _catalog_version = version
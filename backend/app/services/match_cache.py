@@ -0,0 +1,286 @@
+# backend/app/services/match_cache.py
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..core.config import (
+    MATCH_CACHE_SHARED,
+    MATCH_CACHE_SHARED_TTL_SECONDS,
+    MATCH_CACHE_SIZE,
+    MATCH_CACHE_TTL_SECONDS,
+)
+from ..models.match import Match as MatchModel
+from ..schemas import Match
+
+
+# -------------------------------
+# Shared tier
+# -------------------------------
+class SharedCache(ABC):
+    """
+    Cross-worker key/value store (e.g. Redis). Values are bytes.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+
+class LocalSharedCache(SharedCache):
+    """
+    In-process stand-in for the shared tier (tests, single worker).
+    Not shared between uvicorn workers.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+def get_shared_cache(spec: str = MATCH_CACHE_SHARED) -> Optional[SharedCache]:
+    """
+    - none  : no shared tier (default)
+    - local : LocalSharedCache
+    """
+    if spec == "local":
+        return LocalSharedCache()
+    if spec == "none":
+        return None
+    raise ValueError(f"Unknown shared match cache: {spec}")
+
+
+# -------------------------------
+# Two-level match cache
+# -------------------------------
+class MatchCache:
+    """
+    Read-through cache of serialized matches keyed by id.
+
+    - L1: bounded in-process LRU with a short TTL
+    - L2: optional shared tier, refreshed on write
+    - matches.version (bumped by the DB on every update) is the version:
+      an older version never replaces a newer one in L2, and an expired L1
+      entry is revalidated against the DB version before it is reused, so
+      a worker serves another worker's stale copy for at most the L1 TTL
+    """
+
+    def __init__(
+        self,
+        shared: Optional[SharedCache] = None,
+        size: int = MATCH_CACHE_SIZE,
+        ttl: float = MATCH_CACHE_TTL_SECONDS,
+        shared_ttl: float = MATCH_CACHE_SHARED_TTL_SECONDS,
+    ) -> None:
+        self.shared = shared
+        self.size = size
+        self.ttl = ttl
+        self.shared_ttl = shared_ttl
+
+        # match_id -> (cached_at, version, data)
+        self._local: "OrderedDict[int, Tuple[float, int, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.stats = {
+                "l1_hits": 0,
+                "revalidations": 0,        # L1 만료 후 DB 버전이 같아서 그대로 재사용
+                "l2_hits": 0,
+                "misses": 0,
+                "writes": 0,
+                "invalidations": 0,
+                "stale_reads": 0,          # L1 만료 시 DB 에 더 새 버전이 있었던 횟수
+                "stale_seconds_total": 0.0,
+                "stale_seconds_max": 0.0,
+            }
+
+    def _count(self, name: str, amount=1) -> None:
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    # ---------- reads ----------
+    def get(self, db: Session, match_id: int) -> Optional[dict]:
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._local.get(match_id)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._local.move_to_end(match_id)
+                entry_data = entry[2]
+            else:
+                entry_data = None
+        if entry_data is not None:
+            self._count("l1_hits")
+            return entry_data
+
+        if entry is not None:
+            return self._revalidate(db, match_id, entry, now)
+
+        data = self._shared_get(match_id)
+        if data is not None:
+            self._count("l2_hits")
+        else:
+            data = self._load(db, match_id)
+            if data is None:
+                return None
+
+        self._local_set(match_id, data)
+        return data
+
+    def _revalidate(
+        self,
+        db: Session,
+        match_id: int,
+        entry: Tuple[float, int, dict],
+        now: float,
+    ) -> Optional[dict]:
+        """Expired L1 entry: compare with the DB version (one indexed scalar query)."""
+        cached_at, version, data = entry
+        current = db.query(MatchModel.version).filter(MatchModel.id == match_id).scalar()
+        if current is None:
+            self.invalidate(match_id)
+            return None
+
+        if current == version:
+            self._count("revalidations")
+            self._local_set(match_id, data)
+            return data
+
+        stale_for = now - cached_at
+        with self._stats_lock:
+            self.stats["stale_reads"] += 1
+            self.stats["stale_seconds_total"] += stale_for
+            self.stats["stale_seconds_max"] = max(self.stats["stale_seconds_max"], stale_for)
+
+        fresh = self._shared_get(match_id)
+        if fresh is not None and fresh["version"] == current:
+            self._count("l2_hits")
+        else:
+            fresh = self._load(db, match_id)
+            if fresh is None:
+                return None
+
+        self._local_set(match_id, fresh)
+        return fresh
+
+    def _load(self, db: Session, match_id: int) -> Optional[dict]:
+        match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
+        self._count("misses")
+        if match is None:
+            self.invalidate(match_id)
+            return None
+        data = serialize(match)
+        self._shared_set(match_id, data)
+        return data
+
+    # ---------- writes ----------
+    def put(self, match: MatchModel) -> None:
+        """Write-through after a committed change."""
+        data = serialize(match)
+        self._count("writes")
+        self._local_set(match.id, data)
+        self._shared_set(match.id, data)
+
+    def invalidate(self, match_id: int) -> None:
+        self._count("invalidations")
+        with self._lock:
+            self._local.pop(match_id, None)
+        if self.shared is not None:
+            self.shared.delete(_key(match_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def stats_dict(self) -> dict:
+        with self._stats_lock:
+            s = dict(self.stats)
+        avg_stale = s["stale_seconds_total"] / s["stale_reads"] if s["stale_reads"] else None
+        hits = s["l1_hits"] + s["revalidations"] + s["l2_hits"]
+        reads = hits + s["misses"]
+        s["reads"] = reads
+        s["hit_rate"] = round(hits / reads, 4) if reads else None
+        s["l1_hit_rate"] = round((s["l1_hits"] + s["revalidations"]) / reads, 4) if reads else None
+        s["stale_seconds_total"] = round(s["stale_seconds_total"], 4)
+        s["stale_seconds_max"] = round(s["stale_seconds_max"], 4)
+        s["stale_seconds_avg"] = round(avg_stale, 4) if avg_stale is not None else None
+        s["l1_size"] = len(self._local)
+        s["l1_capacity"] = self.size
+        s["l1_ttl_seconds"] = self.ttl
+        s["shared"] = type(self.shared).__name__ if self.shared is not None else None
+        return s
+
+    # ---------- tiers ----------
+    def _local_set(self, match_id: int, data: dict) -> None:
+        with self._lock:
+            current = self._local.get(match_id)
+            if current is not None and current[1] > data["version"]:
+                return
+            self._local[match_id] = (time.monotonic(), data["version"], data)
+            self._local.move_to_end(match_id)
+            while len(self._local) > self.size:
+                self._local.popitem(last=False)
+
+    def _shared_get(self, match_id: int) -> Optional[dict]:
+        if self.shared is None:
+            return None
+        raw = self.shared.get(_key(match_id))
+        return json.loads(raw) if raw is not None else None
+
+    def _shared_set(self, match_id: int, data: dict) -> None:
+        if self.shared is None:
+            return
+        current = self._shared_get(match_id)
+        if current is not None and current["version"] > data["version"]:
+            return
+        self.shared.set(
+            _key(match_id),
+            json.dumps(data, ensure_ascii=False).encode("utf-8"),
+            self.shared_ttl,
+        )
+
+
+def _key(match_id: int) -> str:
+    return f"match:{match_id}"
+
+
+def serialize(match: MatchModel) -> dict:
+    return Match.model_validate(match).model_dump(mode="json")
+
+
+match_cache = MatchCache(get_shared_cache())
@@ -0,0 +1,54 @@
+# backend/app/services/notifications.py
+
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import List
+
+from ..core.config import OUTBOX_SINK
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationSink(ABC):
+    """
+    Delivery backend for coalesced notifications.
+    send() gets every pending event for one recipient; raise to retry later.
+    """
+
+    @abstractmethod
+    def send(self, recipient_id: int, events: List[dict]) -> None:
+        ...
+
+
+class LogSink(NotificationSink):
+    def send(self, recipient_id: int, events: List[dict]) -> None:
+        logger.info("notify user %s: %s", recipient_id, events)
+
+
+class FileSink(NotificationSink):
+    """
+    Appends one JSON line per recipient per batch (local testing).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send(self, recipient_id: int, events: List[dict]) -> None:
+        line = json.dumps({"recipient_id": recipient_id, "events": events}, ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def get_sink(spec: str = OUTBOX_SINK) -> NotificationSink:
+    """
+    - log          : LogSink
+    - file:<path>  : FileSink
+    """
+    if spec.startswith("file:"):
+        return FileSink(spec[len("file:"):])
+    if spec == "log":
+        return LogSink()
+    raise ValueError(f"Unknown notification sink: {spec}")
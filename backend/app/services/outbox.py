@@ -0,0 +1,228 @@
+# backend/app/services/outbox.py
+
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ..core.config import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_LEASE_SECONDS,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_POLL_SECONDS,
+    OUTBOX_RETRY_BASE_SECONDS,
+)
+from ..db.session import SessionLocal
+from ..models.match import Match as MatchModel
+from ..models.outbox import OutboxEvent
+from .notifications import NotificationSink
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY_SECONDS = 3600
+
+
+def enqueue_match_event(
+    db: Session,
+    event_type: str,
+    match: MatchModel,
+    actor_id: Optional[int],
+    recipient_ids: Iterable[Optional[int]],
+) -> None:
+    """
+    Append one outbox row per recipient (actor excluded).
+    Does not commit; rows land in the caller's transaction.
+    """
+    payload = json.dumps({"title": match.title, "date": match.date.isoformat()}, ensure_ascii=False)
+    for recipient_id in set(recipient_ids):
+        if recipient_id is None or recipient_id == actor_id:
+            continue
+        db.add(
+            OutboxEvent(
+                event_type=event_type,
+                match_id=match.id,
+                actor_id=actor_id,
+                recipient_id=recipient_id,
+                payload=payload,
+            )
+        )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    seconds = OUTBOX_RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+    return timedelta(seconds=min(seconds, MAX_RETRY_DELAY_SECONDS))
+
+
+def claim_batch(
+    db: Session,
+    owner: str,
+    batch_size: int,
+    now: datetime,
+) -> List[int]:
+    """
+    Lease up to batch_size due PENDING events to `owner` and commit.
+    The UPDATE re-checks the lease, so concurrent dispatchers (other
+    workers) never claim the same row; an expired lease can be re-claimed.
+    """
+    due = (
+        OutboxEvent.status == "PENDING",
+        OutboxEvent.next_attempt_at <= now,
+        or_(OutboxEvent.claimed_until.is_(None), OutboxEvent.claimed_until < now),
+    )
+    candidates = [
+        event_id
+        for (event_id,) in db.query(OutboxEvent.id)
+        .filter(*due)
+        .order_by(OutboxEvent.id)
+        .limit(batch_size)
+    ]
+    if not candidates:
+        db.commit()
+        return []
+
+    db.query(OutboxEvent).filter(OutboxEvent.id.in_(candidates), *due).update(
+        {
+            OutboxEvent.claimed_by: owner,
+            OutboxEvent.claimed_until: now + timedelta(seconds=OUTBOX_LEASE_SECONDS),
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+    return [
+        event_id
+        for (event_id,) in db.query(OutboxEvent.id)
+        .filter(OutboxEvent.id.in_(candidates), OutboxEvent.claimed_by == owner)
+        .order_by(OutboxEvent.id)
+    ]
+
+
+def drain_outbox(
+    db: Session,
+    sink: NotificationSink,
+    batch_size: int = OUTBOX_BATCH_SIZE,
+    now: Optional[datetime] = None,
+) -> int:
+    """
+    Deliver one batch of due PENDING events, coalesced per recipient.
+
+    1. claim the batch (committed lease)
+    2. call the sink with no transaction or row lock held
+    3. record SENT / retry / FAILED and release the lease
+    Returns the number of events picked up.
+    """
+    now = now or datetime.now(timezone.utc)
+    owner = uuid.uuid4().hex
+
+    claimed = claim_batch(db, owner, batch_size, now)
+    if not claimed:
+        return 0
+
+    by_recipient: Dict[int, List[dict]] = {}
+    for e in db.query(OutboxEvent).filter(OutboxEvent.id.in_(claimed)).order_by(OutboxEvent.id):
+        by_recipient.setdefault(e.recipient_id, []).append(
+            {
+                "id": e.id,
+                "type": e.event_type,
+                "match_id": e.match_id,
+                "actor_id": e.actor_id,
+                **(json.loads(e.payload) if e.payload else {}),
+            }
+        )
+    db.commit()  # 읽기 트랜잭션도 닫고 보낸다 (SQLite 는 읽기 중에도 쓰기를 막음)
+
+    errors: Dict[int, str] = {}
+    for recipient_id, events in by_recipient.items():
+        try:
+            sink.send(recipient_id, events)
+        except Exception as exc:
+            logger.warning("notification to user %s failed: %s", recipient_id, exc)
+            for event in events:
+                errors[event["id"]] = str(exc)[:500]
+
+    for e in db.query(OutboxEvent).filter(
+        OutboxEvent.id.in_(claimed), OutboxEvent.claimed_by == owner
+    ):
+        e.claimed_by = None
+        e.claimed_until = None
+        if e.id not in errors:
+            e.status = "SENT"
+            e.sent_at = now
+            continue
+
+        e.attempts += 1
+        e.last_error = errors[e.id]
+        if e.attempts >= OUTBOX_MAX_ATTEMPTS:
+            e.status = "FAILED"
+        else:
+            e.next_attempt_at = now + retry_delay(e.attempts)
+
+    db.commit()
+    return len(claimed)
+
+
+def purge_sent_outbox(db: Session, before: datetime) -> int:
+    """
+    Delete events delivered before `before`. FAILED rows are kept for inspection.
+    """
+    removed = (
+        db.query(OutboxEvent)
+        .filter(OutboxEvent.status == "SENT", OutboxEvent.sent_at < before)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return removed
+
+
+class OutboxDispatcher:
+    """
+    Background loop that drains the outbox in batches.
+    Runs the blocking DB/sink work in a thread so the event loop stays free.
+    """
+
+    def __init__(
+        self,
+        sink: NotificationSink,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_seconds: float = OUTBOX_POLL_SECONDS,
+    ) -> None:
+        self.sink = sink
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def drain_once(self) -> int:
+        db = SessionLocal()
+        try:
+            return drain_outbox(db, self.sink, self.batch_size)
+        except Exception:
+            db.rollback()
+            logger.exception("outbox drain failed")
+            return 0
+        finally:
+            db.close()
+
+    async def run(self) -> None:
+        while True:
+            picked = await asyncio.to_thread(self.drain_once)
+            # 배치가 꽉 찼으면 바로 다음 배치, 아니면 잠깐 대기
+            if picked < self.batch_size:
+                await asyncio.sleep(self.poll_seconds)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
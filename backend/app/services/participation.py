@@ -0,0 +1,129 @@
+# backend/app/services/participation.py
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.participation import (
+    Participation as ParticipationModel,
+    ParticipationEvent,
+    ParticipationEventRollup,
+)
+
+
+def get_participation(
+    db: Session,
+    match_id: int,
+    user_id: int,
+) -> Optional[ParticipationModel]:
+    """
+    Current-state row for (match, user); single unique-index hit.
+    Newest first, in case a DB still holds pre-migration duplicates.
+    """
+    return (
+        db.query(ParticipationModel)
+        .filter(
+            ParticipationModel.match_id == match_id,
+            ParticipationModel.user_id == user_id,
+        )
+        .order_by(ParticipationModel.id.desc())
+        .first()
+    )
+
+
+def set_participation(
+    db: Session,
+    match_id: int,
+    user_id: int,
+    status: str,
+    current: Optional[ParticipationModel] = None,
+) -> ParticipationModel:
+    """
+    Upsert the current-state row and append a JOIN/LEAVE event.
+    Does not commit; the caller owns the transaction.
+    """
+    if current is None:
+        current = ParticipationModel(match_id=match_id, user_id=user_id, status=status)
+        db.add(current)
+    else:
+        current.status = status
+
+    db.add(
+        ParticipationEvent(
+            match_id=match_id,
+            user_id=user_id,
+            action="JOIN" if status == "JOINED" else "LEAVE",
+        )
+    )
+    return current
+
+
+def compact_participation_events(db: Session, before: datetime) -> int:
+    """
+    Roll up events older than `before` into per-(match, day) counts and
+    delete them. Returns the number of events removed.
+    """
+    max_id = (
+        db.query(func.max(ParticipationEvent.id))
+        .filter(ParticipationEvent.created_at < before)
+        .scalar()
+    )
+    if max_id is None:
+        return 0
+
+    window = (
+        ParticipationEvent.id <= max_id,
+        ParticipationEvent.created_at < before,
+    )
+
+    day = func.date(ParticipationEvent.created_at)
+    rows = (
+        db.query(
+            ParticipationEvent.match_id,
+            day,
+            ParticipationEvent.action,
+            func.count(ParticipationEvent.id),
+        )
+        .filter(*window)
+        .group_by(ParticipationEvent.match_id, day, ParticipationEvent.action)
+        .all()
+    )
+
+    rollups = {}
+    for match_id, event_day, action, count in rows:
+        if isinstance(event_day, str):
+            # SQLite 는 date() 결과를 문자열로 돌려줌
+            event_day = datetime.strptime(event_day, "%Y-%m-%d").date()
+
+        key = (match_id, event_day)
+        rollup = rollups.get(key)
+        if rollup is None:
+            rollup = (
+                db.query(ParticipationEventRollup)
+                .filter(
+                    ParticipationEventRollup.match_id == match_id,
+                    ParticipationEventRollup.day == event_day,
+                )
+                .first()
+            )
+            if rollup is None:
+                rollup = ParticipationEventRollup(
+                    match_id=match_id, day=event_day, joins=0, leaves=0
+                )
+                db.add(rollup)
+            rollups[key] = rollup
+
+        if action == "JOIN":
+            rollup.joins += count
+        else:
+            rollup.leaves += count
+
+    removed = (
+        db.query(ParticipationEvent)
+        .filter(*window)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return removed
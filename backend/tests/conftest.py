@@ -0,0 +1,61 @@
+# backend/tests/conftest.py
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from backend.app.api import matches, sports
+from backend.app.db.base import init_db
+from backend.app.db.session import get_db
+from backend.app.services import catalog
+from backend.app.services.match_cache import match_cache
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite shared across connections (StaticPool)."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Session on a freshly initialized schema (tables, migrations, seed data)."""
+    init_db(engine)
+    session = Session(bind=engine)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(db, engine, monkeypatch):
+    """
+    Routers on a bare app (no lifespan) with get_db bound to the test engine.
+    Process-level caches start empty so nothing leaks between tests.
+    """
+    monkeypatch.setattr(catalog, "_catalog", None)
+    monkeypatch.setattr(catalog, "_catalog_version", None)
+    match_cache.clear()
+
+    def override_get_db():
+        session = Session(bind=engine)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app = FastAPI()
+    app.include_router(matches.router)
+    app.include_router(sports.router)
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as client:
+        yield client
+    match_cache.clear()
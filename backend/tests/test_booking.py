@@ -0,0 +1,156 @@
+# backend/tests/test_booking.py
+
+from datetime import date, time
+
+import pytest
+
+from backend.app.core.config import DEFAULT_MATCH_DURATION_MINUTES
+from backend.app.models.match import Match as MatchModel
+from backend.app.models.participation import Participation as ParticipationModel
+from backend.app.services.booking import (
+    DAY_END,
+    DAY_START,
+    find_schedule_conflict,
+    find_venue_conflict,
+    free_slots,
+    match_interval,
+    venue_bookings,
+)
+
+DAY = date(2026, 11, 1)
+
+
+def booking(start, end=None):
+    """Unsaved match; free_slots/match_interval only read the times."""
+    return MatchModel(start_time=start, end_time=end)
+
+
+def add_match(db, start, end=None, location="gym", status="OPEN", on_date=DAY):
+    m = MatchModel(
+        title="m",
+        location=location,
+        date=on_date,
+        start_time=start,
+        end_time=end,
+        max_people=10,
+        status=status,
+    )
+    db.add(m)
+    db.commit()
+    return m
+
+
+# -------------------------------
+# match_interval
+# -------------------------------
+def test_missing_end_uses_default_duration():
+    assert DEFAULT_MATCH_DURATION_MINUTES == 120
+    assert match_interval(time(18, 0), None) == (time(18, 0), time(20, 0))
+
+
+def test_default_duration_past_midnight_is_clipped():
+    assert match_interval(time(23, 0), None) == (time(23, 0), DAY_END)
+
+
+@pytest.mark.parametrize("end", [time(1, 0), time(22, 0)])
+def test_end_not_after_start_occupies_rest_of_day(end):
+    assert match_interval(time(22, 0), end) == (time(22, 0), DAY_END)
+
+
+# -------------------------------
+# free_slots
+# -------------------------------
+def test_empty_day_is_one_free_slot():
+    assert free_slots([]) == ([], [(DAY_START, DAY_END)])
+
+
+def test_overlapping_and_contained_bookings_are_merged():
+    busy, free = free_slots(
+        [
+            booking(time(9, 0), time(11, 0)),
+            booking(time(10, 0), time(12, 0)),
+            booking(time(10, 30), time(11, 0)),
+            booking(time(15, 0), time(16, 0)),
+        ]
+    )
+    assert busy == [(time(9, 0), time(12, 0)), (time(15, 0), time(16, 0))]
+    assert free == [
+        (DAY_START, time(9, 0)),
+        (time(12, 0), time(15, 0)),
+        (time(16, 0), DAY_END),
+    ]
+
+
+def test_touching_bookings_leave_no_gap():
+    busy, free = free_slots(
+        [booking(time(9, 0), time(10, 0)), booking(time(10, 0), time(11, 0))]
+    )
+    assert busy == [(time(9, 0), time(11, 0))]
+    assert free == [(DAY_START, time(9, 0)), (time(11, 0), DAY_END)]
+
+
+def test_booking_past_midnight_closes_the_day():
+    busy, free = free_slots(
+        [booking(time(0, 0), time(6, 0)), booking(time(22, 0), time(2, 0))]
+    )
+    assert busy == [(time(0, 0), time(6, 0)), (time(22, 0), DAY_END)]
+    assert free == [(time(6, 0), time(22, 0))]
+
+
+# -------------------------------
+# DB lookups
+# -------------------------------
+def test_venue_conflict_ignores_cancelled_other_venues_and_self(db):
+    booked = add_match(db, time(18, 0), time(20, 0))
+    add_match(db, time(18, 0), time(20, 0), status="CANCELLED")
+    add_match(db, time(18, 0), time(20, 0), location="park")
+
+    assert find_venue_conflict(db, "gym", DAY, time(19, 0), time(21, 0)).id == booked.id
+    assert find_venue_conflict(db, "gym", DAY, time(20, 0), time(21, 0)) is None
+    assert find_venue_conflict(
+        db, "gym", DAY, time(19, 0), time(21, 0), exclude_match_id=booked.id
+    ) is None
+    assert [m.id for m in venue_bookings(db, "gym", DAY)] == [booked.id]
+
+
+def test_schedule_conflict_only_checks_joined_matches(db):
+    joined = add_match(db, time(18, 0), time(20, 0), location="a")
+    left = add_match(db, time(20, 0), time(22, 0), location="b")
+    target = add_match(db, time(19, 0), None, location="c")
+    db.add_all(
+        [
+            ParticipationModel(match_id=joined.id, user_id=1, status="JOINED"),
+            ParticipationModel(match_id=left.id, user_id=1, status="CANCELLED"),
+        ]
+    )
+    db.commit()
+
+    assert find_schedule_conflict(db, 1, target).id == joined.id
+    assert find_schedule_conflict(db, 2, target) is None
+
+
+# -------------------------------
+# PUT /matches/{id} venue re-check
+# -------------------------------
+def test_update_rechecks_venue_only_when_placement_changes(client, db):
+    # 예약 검사 이전에 이미 겹쳐 들어간 두 매칭
+    old = add_match(db, time(18, 0), time(20, 0))
+    target = add_match(db, time(19, 0), time(21, 0))
+    url = f"/matches/{target.id}"
+    same_place = {
+        "location": "gym",
+        "date": DAY.isoformat(),
+        "start_time": "19:00:00",
+        "end_time": "21:00:00",
+    }
+
+    assert client.put(url, json={"status": "CLOSED"}).status_code == 200
+    assert client.put(url, json={**same_place, "title": "renamed"}).status_code == 200
+    assert client.put(url, json={"end_time": "21:30:00"}).status_code == 409
+    assert client.put(url, json={"start_time": "20:00:00", "end_time": "21:30:00"}).status_code == 200
+
+    # 취소됐다가 되살아나면 다시 검사
+    assert client.put(f"/matches/{old.id}", json={"status": "CANCELLED"}).status_code == 200
+    assert client.put(url, json={"start_time": "19:00:00"}).status_code == 200
+    assert client.put(f"/matches/{old.id}", json={"status": "OPEN"}).status_code == 409
+    assert client.put(url, json={"date": "2026-11-02"}).json()["date"] == "2026-11-02"
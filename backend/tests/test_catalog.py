@@ -0,0 +1,163 @@
+# backend/tests/test_catalog.py
+
+import pytest
+from sqlalchemy import text
+
+from backend.app.api import sports as sports_api
+from backend.app.models.sport import Sport
+from backend.app.services import catalog as catalog_service
+from backend.app.services.catalog import get_catalog, load_catalog, stored_version
+
+
+# -------------------------------
+# SportCatalog lookups
+# -------------------------------
+def test_sport_lookup_by_code_or_name_ignores_case_and_spaces(db):
+    catalog = load_catalog(db)
+    basketball = catalog.sport_id("basketball")
+
+    assert basketball is not None
+    assert catalog.sport_id("  BasketBall ") == basketball
+    assert catalog.sport_id("농구") == basketball
+    assert catalog.sport_id(" 농구\t") == basketball
+    assert catalog.sport_id("tennis") != basketball
+    assert catalog.sport_id("풋살") is None
+    assert catalog.sport_id("") is None
+    assert catalog.sport_id(None) is None
+
+
+def test_category_lookups(db):
+    catalog = load_catalog(db)
+    basketball = catalog.sport_id("basketball")
+    tennis = catalog.sport_id("tennis")
+
+    pickup = catalog.category_id(basketball, " PickUp ")
+    assert pickup is not None
+    assert catalog.category_sport_id(pickup) == basketball
+    assert catalog.category_id(tennis, "pickup") is None
+    assert catalog.category_ids("pickup") == [pickup]
+    assert catalog.category_ids("nope") == []
+    assert catalog.category_sport_id(None) is None
+
+
+def test_get_sport_by_exact_code(db):
+    catalog = load_catalog(db)
+    assert catalog.get_sport("basketball") is not None
+    assert catalog.get_sport("unknown") is None
+
+
+# -------------------------------
+# Cross-worker reload via catalog_version
+# -------------------------------
+def rename_in_other_worker(db, code, name):
+    """What reload_catalog does, minus this worker's in-memory swap."""
+    db.query(Sport).filter(Sport.code == code).update({Sport.name: name})
+    db.execute(
+        text(
+            "UPDATE schema_meta SET value = CAST(CAST(value AS INTEGER) + 1 AS VARCHAR) "
+            "WHERE key = 'catalog_version'"
+        )
+    )
+    db.commit()
+
+
+def test_catalog_follows_version_bump_after_check_interval(db, monkeypatch):
+    monkeypatch.setattr(catalog_service, "_catalog", None)
+    monkeypatch.setattr(catalog_service, "_catalog_version", None)
+    monkeypatch.setattr(catalog_service, "CATALOG_CHECK_SECONDS", 3600)
+
+    first = get_catalog(db)
+    assert stored_version(db) == "1"
+
+    rename_in_other_worker(db, "tennis", "정구")
+    assert get_catalog(db) is first  # 확인 간격 전에는 DB 를 보지 않음
+
+    monkeypatch.setattr(catalog_service, "CATALOG_CHECK_SECONDS", 0)
+    fresh = get_catalog(db)
+    assert fresh is not first
+    assert fresh.sport_id("정구") == fresh.sport_id("tennis")
+    assert get_catalog(db) is fresh  # 버전이 같으면 다시 읽지 않음
+
+
+# -------------------------------
+# /sports endpoints
+# -------------------------------
+@pytest.mark.parametrize("path", ["/sports/", "/sports/basketball"])
+def test_sports_etag_200_then_304(client, path):
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.json()
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    other = client.get(path, headers={"If-None-Match": '"stale"'})
+    assert other.status_code == 200
+
+
+def test_unknown_sport_404(client):
+    assert client.get("/sports/unknown").status_code == 404
+
+
+def test_reload_requires_admin(client, monkeypatch):
+    monkeypatch.setattr(sports_api, "ADMIN_USER_IDS", {7})
+    assert client.post("/sports/reload", headers={"X-User-Id": "8"}).status_code == 403
+    assert client.post("/sports/reload").status_code == 403  # 기본 유저 1
+
+
+def test_reload_bumps_version_and_etag(client, db, monkeypatch):
+    monkeypatch.setattr(sports_api, "ADMIN_USER_IDS", {7})
+    before = client.get("/sports/").headers["etag"]
+
+    db.query(Sport).filter(Sport.code == "soccer").update({Sport.status: "active"})
+    db.commit()
+    resp = client.post("/sports/reload", headers={"X-User-Id": "7"})
+
+    assert resp.status_code == 200
+    assert resp.json()["etag"] != before
+    assert client.get("/sports/").headers["etag"] == resp.json()["etag"]
+    assert stored_version(db) == "2"
+
+
+# -------------------------------
+# list_matches ?sport= / ?category=
+# -------------------------------
+def create(client, location, sport=None, category=None):
+    body = {
+        "title": location,
+        "location": location,
+        "date": "2026-11-01",
+        "start_time": "18:00:00",
+        "max_people": 10,
+        "sport": sport,
+        "category": category,
+    }
+    resp = client.post("/matches/", json=body)
+    assert resp.status_code == 201, resp.text
+    return resp.json()["id"]
+
+
+def listed(client, **params):
+    resp = client.get("/matches/", params=params)
+    assert resp.status_code == 200
+    return sorted(m["id"] for m in resp.json())
+
+
+def test_list_matches_sport_and_category_filters(client):
+    pickup = create(client, "a", sport="basketball", category="pickup")
+    guest = create(client, "b", sport="농구", category="guest")
+    plain = create(client, "c", sport=" Basketball ")
+    tennis = create(client, "d", sport="tennis")
+    futsal = create(client, "e", sport="풋살")
+
+    assert listed(client) == sorted([pickup, guest, plain, tennis, futsal])
+    assert listed(client, sport="basketball") == sorted([pickup, guest, plain])
+    assert listed(client, sport="농구") == sorted([pickup, guest, plain])
+    assert listed(client, sport="BASKETBALL", category="pickup") == [pickup]
+    assert listed(client, category="guest") == [guest]
+    assert listed(client, sport="basketball", category="nope") == []
+    assert listed(client, sport="tennis") == [tennis]
+    assert listed(client, sport="풋살") == [futsal]  # 카탈로그에 없는 종목은 문자열 그대로
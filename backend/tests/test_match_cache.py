@@ -0,0 +1,131 @@
+# backend/tests/test_match_cache.py
+
+from datetime import date, time
+
+import pytest
+
+from backend.app.models.match import Match as MatchModel
+from backend.app.services.match_cache import (
+    LocalSharedCache,
+    MatchCache,
+    SharedCache,
+    serialize,
+)
+
+
+@pytest.fixture
+def match(db):
+    m = MatchModel(
+        title="pickup",
+        location="gym",
+        date=date(2026, 11, 1),
+        start_time=time(18, 0),
+        max_people=10,
+    )
+    db.add(m)
+    db.commit()
+    db.refresh(m)
+    return m
+
+
+def update(db, match, **fields):
+    for field, value in fields.items():
+        setattr(match, field, value)
+    db.commit()
+    db.refresh(match)
+
+
+def test_version_bumps_on_every_update_even_within_one_second(db, match):
+    assert match.version == 1
+    update(db, match, title="a")
+    update(db, match, title="b")
+    assert match.version == 3
+
+
+def test_read_through_then_l1_hit(db, match):
+    cache = MatchCache(ttl=60)
+    assert cache.get(db, match.id)["title"] == "pickup"
+    assert cache.get(db, match.id)["title"] == "pickup"
+
+    stats = cache.stats_dict()
+    assert (stats["misses"], stats["l1_hits"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_expired_entry_is_revalidated_against_the_db(db, match):
+    cache = MatchCache(ttl=0)
+    cache.get(db, match.id)
+    assert cache.get(db, match.id)["version"] == 1
+
+    stats = cache.stats_dict()
+    assert (stats["revalidations"], stats["stale_reads"], stats["misses"]) == (1, 0, 1)
+
+
+def test_write_from_another_worker_is_detected_on_expiry(db, match):
+    shared = LocalSharedCache()
+    ours, theirs = MatchCache(shared, ttl=0), MatchCache(shared, ttl=0)
+    ours.get(db, match.id)
+
+    update(db, match, title="changed")
+    theirs.put(match)
+
+    data = ours.get(db, match.id)
+    assert (data["title"], data["version"]) == ("changed", 2)
+    stats = ours.stats_dict()
+    assert (stats["stale_reads"], stats["l2_hits"]) == (1, 1)
+
+
+def test_stale_shared_copy_is_not_trusted_after_expiry(db, match):
+    ours = MatchCache(LocalSharedCache(), ttl=0)
+    ours.get(db, match.id)
+
+    # 다른 워커가 DB 만 바꾸고 이 공유 캐시는 못 건드린 경우
+    update(db, match, title="changed")
+
+    assert ours.get(db, match.id)["title"] == "changed"
+    assert ours.stats_dict()["stale_reads"] == 1
+
+
+def test_older_version_never_overwrites_newer_in_shared_tier(db, match):
+    shared = LocalSharedCache()
+    cache = MatchCache(shared, ttl=60)
+    old = serialize(match)
+
+    update(db, match, title="new")
+    cache.put(match)
+    cache._shared_set(match.id, old)
+
+    assert MatchCache(shared, ttl=60).get(db, match.id)["title"] == "new"
+
+
+def test_deleted_match_is_dropped_on_expiry(db, match):
+    cache = MatchCache(LocalSharedCache(), ttl=0)
+    cache.get(db, match.id)
+    db.delete(match)
+    db.commit()
+
+    assert cache.get(db, match.id) is None
+    assert cache.stats_dict()["l1_size"] == 0
+
+
+def test_l1_is_bounded_lru(db, match):
+    cache = MatchCache(size=1, ttl=60)
+    other = MatchModel(
+        title="other", location="park", date=date(2026, 11, 1), start_time=time(9, 0), max_people=4
+    )
+    db.add(other)
+    db.commit()
+
+    cache.get(db, match.id)
+    cache.get(db, other.id)
+    assert cache.stats_dict()["l1_size"] == 1
+    cache.get(db, match.id)
+    assert cache.stats_dict()["misses"] == 3
+
+
+def test_shared_cache_missing_methods_fails_at_construction():
+    class Incomplete(SharedCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,198 @@
+# backend/tests/test_migrations.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from backend.app.db.base import SchemaMismatchError, init_db
+from backend.app.db.base_class import Base
+from backend.app.db import migrations
+from backend.app.db.migrations import HEAD, MIGRATIONS
+from backend.app.db.seed import seed_sports
+
+# 첫 배포 때 create_all 로 만들어진 테이블 (app.db 와 같은 모양)
+LEGACY_DDL = [
+    """CREATE TABLE matches (
+        id INTEGER NOT NULL, title VARCHAR NOT NULL, description VARCHAR,
+        sport VARCHAR, location VARCHAR NOT NULL, date DATE NOT NULL,
+        start_time TIME NOT NULL, end_time TIME, max_people INTEGER NOT NULL,
+        owner_id INTEGER, status VARCHAR NOT NULL, current_people INTEGER NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        PRIMARY KEY (id))""",
+    "CREATE INDEX ix_matches_id ON matches (id)",
+    """CREATE TABLE participations (
+        id INTEGER NOT NULL, match_id INTEGER NOT NULL, user_id INTEGER NOT NULL,
+        status VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(match_id) REFERENCES matches (id) ON DELETE CASCADE)""",
+    "CREATE INDEX ix_participations_match_id ON participations (match_id)",
+    "CREATE INDEX ix_participations_id ON participations (id)",
+    "CREATE INDEX ix_participations_user_id ON participations (user_id)",
+]
+
+
+def make_legacy_db(engine, matches):
+    with engine.begin() as conn:
+        for ddl in LEGACY_DDL:
+            conn.execute(text(ddl))
+        for match_id, sport in matches:
+            conn.execute(
+                text(
+                    "INSERT INTO matches (id, title, sport, location, date, start_time,"
+                    " max_people, status, current_people)"
+                    " VALUES (:id, 't', :sport, 'gym', '2025-11-30', '19:00:00', 10, 'OPEN', 0)"
+                ),
+                {"id": match_id, "sport": sport},
+            )
+
+
+def fingerprint(engine):
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT value FROM schema_meta WHERE key = 'fingerprint'")
+        ).scalar()
+
+
+def test_fresh_db_is_stamped_and_next_boot_skips_ddl(engine):
+    assert init_db(engine) is True
+    assert fingerprint(engine) is not None
+    with engine.connect() as conn:
+        version = conn.execute(
+            text("SELECT value FROM schema_meta WHERE key = 'version'")
+        ).scalar()
+    assert int(version) == HEAD
+
+    assert init_db(engine) is False
+
+
+def test_unmigrated_drift_fails_without_saving_fingerprint(engine):
+    init_db(engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE sports DROP COLUMN sort_order"))
+        conn.execute(text("DELETE FROM schema_meta WHERE key = 'fingerprint'"))
+
+    with pytest.raises(SchemaMismatchError, match="sports.sort_order"):
+        init_db(engine)
+    assert fingerprint(engine) is None
+
+
+def test_sport_ids_are_added_and_backfilled_from_sport_strings(engine):
+    make_legacy_db(engine, [(1, "농구"), (2, " Basketball "), (3, "풋살"), (4, None)])
+    Base.metadata.create_all(bind=engine)  # sports 테이블만 새로 생김
+    db = Session(bind=engine)
+    seed_sports(db)
+    db.close()
+
+    step = dict(MIGRATIONS)["matches.sport_id / category_id + backfill"]
+    with engine.begin() as conn:
+        step(conn)
+        step(conn)  # 다시 돌아도 안전
+        rows = conn.execute(text("SELECT id, sport_id FROM matches ORDER BY id")).all()
+        basketball = conn.execute(
+            text("SELECT id FROM sports WHERE code = 'basketball'")
+        ).scalar()
+
+    assert rows == [(1, basketball), (2, basketball), (3, None), (4, None)]
+
+
+def test_legacy_db_upgrades_and_merges_duplicate_participations(engine):
+    make_legacy_db(engine, [(1, "농구"), (2, "basketball")])
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO participations (id, match_id, user_id, status) VALUES"
+                " (1, 1, 1, 'CANCELLED'), (2, 1, 1, 'JOINED'),"
+                " (3, 2, 1, 'JOINED'), (4, 2, 1, 'JOINED'), (5, 2, 2, 'JOINED')"
+            )
+        )
+
+    assert init_db(engine) is True
+    assert fingerprint(engine) is not None
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT id, match_id, user_id, status FROM participations ORDER BY id")
+        ).all()
+        people = conn.execute(
+            text("SELECT id, current_people FROM matches ORDER BY id")
+        ).all()
+
+    assert rows == [(2, 1, 1, "JOINED"), (4, 2, 1, "JOINED"), (5, 2, 2, "JOINED")]
+    assert people == [(1, 1), (2, 2)]
+
+    indexes = {i["name"] for i in inspect(engine).get_indexes("participations")}
+    assert "ix_participations_match_id" not in indexes
+    assert "ix_participations_user_id" not in indexes
+    assert {"uq_participations_match_user", "ix_participations_user_status"} <= indexes
+
+    with pytest.raises(Exception):
+        with engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO participations (match_id, user_id, status) VALUES (1, 1, 'JOINED')")
+            )
+
+
+class RecordingConnection:
+    """Collects the SQL a step would send to a Postgres connection."""
+
+    dialect = postgresql.dialect()
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+
+
+@pytest.mark.parametrize(
+    "step, expected",
+    [
+        (
+            migrations._participations_current_state,
+            "ALTER TABLE participations ADD COLUMN updated_at TIMESTAMP WITH TIME ZONE",
+        ),
+        (
+            migrations._outbox_claims,
+            "ALTER TABLE outbox_events ADD COLUMN claimed_until TIMESTAMP WITH TIME ZONE",
+        ),
+    ],
+)
+def test_added_columns_use_dialect_types(step, expected, monkeypatch):
+    monkeypatch.setattr(migrations, "_has_column", lambda conn, table, column: False)
+    conn = RecordingConnection()
+    step(conn)
+    assert expected in conn.statements
+    assert not any("DATETIME" in sql for sql in conn.statements)
+
+
+def test_concurrent_boots_run_ddl_once(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    make_legacy_db(create_engine(url), [(1, "농구")])
+
+    workers = 4
+    barrier = threading.Barrier(workers)
+
+    def boot():
+        worker_engine = create_engine(url)  # 워커마다 별도 엔진/연결
+        try:
+            barrier.wait()
+            return init_db(worker_engine)
+        finally:
+            worker_engine.dispose()
+
+    with ThreadPoolExecutor(workers) as pool:
+        results = list(pool.map(lambda _: boot(), range(workers)))
+
+    assert sorted(results) == [False] * (workers - 1) + [True]
+
+    check = create_engine(url)
+    assert fingerprint(check) is not None
+    with check.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM sports")).scalar() == 3
+        assert conn.execute(text("SELECT sport_id FROM matches")).scalar() is not None
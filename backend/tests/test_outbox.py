@@ -0,0 +1,113 @@
+# backend/tests/test_outbox.py
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.app.core.config import OUTBOX_LEASE_SECONDS, OUTBOX_MAX_ATTEMPTS
+from backend.app.models.outbox import OutboxEvent
+from backend.app.services.notifications import NotificationSink
+from backend.app.services.outbox import (
+    claim_batch,
+    drain_outbox,
+    purge_sent_outbox,
+    retry_delay,
+)
+
+NOW = datetime.now(timezone.utc) + timedelta(seconds=5)
+
+
+class RecordingSink(NotificationSink):
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls = []
+
+    def send(self, recipient_id, events):
+        self.calls.append((recipient_id, [e["id"] for e in events]))
+        if self.fail:
+            raise RuntimeError("boom")
+
+
+def add_events(db, *recipients):
+    events = [
+        OutboxEvent(event_type="MATCH_JOINED", match_id=1, actor_id=9, recipient_id=r)
+        for r in recipients
+    ]
+    db.add_all(events)
+    db.commit()
+    return [e.id for e in events]
+
+
+def naive(dt):
+    return dt.replace(tzinfo=None)
+
+
+def test_batch_is_coalesced_per_recipient(db):
+    a1, b1, a2 = add_events(db, 1, 2, 1)
+    sink = RecordingSink()
+
+    assert drain_outbox(db, sink, now=NOW) == 3
+    assert sorted(sink.calls) == [(1, [a1, a2]), (2, [b1])]
+
+    rows = db.query(OutboxEvent).all()
+    assert {r.status for r in rows} == {"SENT"}
+    assert {r.claimed_by for r in rows} == {None}
+    assert drain_outbox(db, sink, now=NOW) == 0
+
+
+def test_failures_back_off_then_fail_after_max_attempts(db):
+    (event_id,) = add_events(db, 1)
+    sink = RecordingSink(fail=True)
+
+    now = NOW
+    for attempt in range(1, OUTBOX_MAX_ATTEMPTS):
+        assert drain_outbox(db, sink, now=now) == 1
+        event = db.get(OutboxEvent, event_id)
+        assert (event.status, event.attempts) == ("PENDING", attempt)
+        assert event.last_error == "boom"
+        assert naive(event.next_attempt_at) == naive(now + retry_delay(attempt))
+
+        # 다음 시도 시각 전에는 안 가져감
+        assert drain_outbox(db, sink, now=now + retry_delay(attempt) - timedelta(seconds=1)) == 0
+        now = now + retry_delay(attempt)
+
+    assert drain_outbox(db, sink, now=now) == 1
+    event = db.get(OutboxEvent, event_id)
+    assert (event.status, event.attempts) == ("FAILED", OUTBOX_MAX_ATTEMPTS)
+    assert drain_outbox(db, sink, now=now + timedelta(days=1)) == 0
+
+
+def test_retry_delay_doubles_and_is_capped():
+    assert retry_delay(2) == 2 * retry_delay(1)
+    assert retry_delay(50) == timedelta(hours=1)
+
+
+def test_claimed_rows_are_skipped_until_the_lease_expires(db):
+    add_events(db, 1, 2)
+    assert len(claim_batch(db, "other-worker", 10, NOW)) == 2
+
+    sink = RecordingSink()
+    assert drain_outbox(db, sink, now=NOW) == 0
+    assert sink.calls == []
+
+    later = NOW + timedelta(seconds=OUTBOX_LEASE_SECONDS + 1)
+    assert drain_outbox(db, sink, now=later) == 2
+
+
+def test_purge_removes_only_old_sent_rows(db):
+    add_events(db, 1)
+    drain_outbox(db, RecordingSink(), now=NOW)
+    add_events(db, 2)
+    drain_outbox(db, RecordingSink(fail=True), now=NOW)
+
+    assert purge_sent_outbox(db, NOW) == 0
+    assert purge_sent_outbox(db, NOW + timedelta(seconds=1)) == 1
+    assert [r.recipient_id for r in db.query(OutboxEvent)] == [2]
+
+
+def test_sink_missing_send_fails_at_construction():
+    class Incomplete(NotificationSink):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
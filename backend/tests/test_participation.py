@@ -0,0 +1,117 @@
+# backend/tests/test_participation.py
+
+from datetime import date, datetime, time
+
+from backend.app.models.match import Match as MatchModel
+from backend.app.models.participation import (
+    Participation as ParticipationModel,
+    ParticipationEvent,
+    ParticipationEventRollup,
+)
+from backend.app.services.participation import (
+    compact_participation_events,
+    get_participation,
+    set_participation,
+)
+
+
+def add_match(db, title="m"):
+    m = MatchModel(
+        title=title,
+        location=title,
+        date=date(2026, 11, 1),
+        start_time=time(18, 0),
+        max_people=10,
+        status="OPEN",
+    )
+    db.add(m)
+    db.commit()
+    return m
+
+
+def add_events(db, match_id, *events):
+    """events: (action, created_at)"""
+    db.add_all(
+        ParticipationEvent(match_id=match_id, user_id=1, action=action, created_at=at)
+        for action, at in events
+    )
+    db.commit()
+
+
+def rollups(db):
+    return [
+        (r.match_id, r.day, r.joins, r.leaves)
+        for r in db.query(ParticipationEventRollup).order_by(
+            ParticipationEventRollup.match_id, ParticipationEventRollup.day
+        )
+    ]
+
+
+# -------------------------------
+# set_participation
+# -------------------------------
+def test_join_leave_join_reuses_one_row_and_logs_events(db):
+    match = add_match(db)
+
+    for status in ("JOINED", "CANCELLED", "JOINED"):
+        current = get_participation(db, match.id, 1)
+        set_participation(db, match.id, 1, status, current)
+        db.commit()
+
+    rows = db.query(ParticipationModel).filter(ParticipationModel.match_id == match.id).all()
+    assert [(r.user_id, r.status) for r in rows] == [(1, "JOINED")]
+
+    actions = [
+        e.action
+        for e in db.query(ParticipationEvent)
+        .filter(ParticipationEvent.match_id == match.id)
+        .order_by(ParticipationEvent.id)
+    ]
+    assert actions == ["JOIN", "LEAVE", "JOIN"]
+
+
+def test_set_participation_does_not_commit(db):
+    match = add_match(db)
+    set_participation(db, match.id, 1, "JOINED")
+    db.rollback()
+
+    assert get_participation(db, match.id, 1) is None
+    assert db.query(ParticipationEvent).count() == 0
+
+
+# -------------------------------
+# compact_participation_events
+# -------------------------------
+def test_compaction_rolls_up_old_events_and_is_safe_to_rerun(db):
+    a = add_match(db, "a")
+    b = add_match(db, "b")
+    add_events(
+        db,
+        a.id,
+        ("JOIN", datetime(2026, 10, 1, 9)),
+        ("JOIN", datetime(2026, 10, 1, 10)),
+        ("LEAVE", datetime(2026, 10, 1, 11)),
+        ("JOIN", datetime(2026, 10, 2, 9)),
+        ("JOIN", datetime(2026, 10, 20, 9)),  # cutoff 이후 → 남음
+    )
+    add_events(db, b.id, ("LEAVE", datetime(2026, 10, 2, 12)))
+    cutoff = datetime(2026, 10, 10)
+
+    assert compact_participation_events(db, cutoff) == 5
+    expected = [
+        (a.id, date(2026, 10, 1), 2, 1),
+        (a.id, date(2026, 10, 2), 1, 0),
+        (b.id, date(2026, 10, 2), 0, 1),
+    ]
+    assert rollups(db) == expected
+    assert db.query(ParticipationEvent).count() == 1
+
+    # 다시 돌려도 이미 집계한 이벤트는 없으니 그대로
+    assert compact_participation_events(db, cutoff) == 0
+    assert rollups(db) == expected
+
+    # 같은 날짜에 늦게 들어온 이벤트는 기존 집계 줄에 더해짐
+    add_events(db, a.id, ("LEAVE", datetime(2026, 10, 1, 23)))
+    assert compact_participation_events(db, cutoff) == 1
+    assert rollups(db)[0] == (a.id, date(2026, 10, 1), 2, 2)
+    assert db.query(ParticipationEventRollup).count() == 3
@@ -0,0 +1,22 @@
+# backend/tests/test_startup.py
+
+from fastapi.testclient import TestClient
+
+from backend.app import main
+from backend.app.db.base import init_db
+
+
+def test_startup_report_after_first_request(engine, monkeypatch):
+    # lifespan 이 실제 app.db 대신 테스트 엔진을 초기화하도록
+    monkeypatch.setattr(main, "init_db", lambda: init_db(engine))
+    monkeypatch.setattr(main, "OUTBOX_ENABLED", False)
+
+    with TestClient(main.app) as client:
+        assert client.get("/health").status_code == 200
+        report = client.get("/health/startup").json()
+
+    for key in ("import_ms", "db_init_ms", "first_request_ms"):
+        assert isinstance(report[key], float) and report[key] >= 0
+    assert report["schema_ddl"] is True  # 빈 DB → DDL 실행
+    assert report["boot_ms"] == round(report["import_ms"] + report["db_init_ms"], 2)
+    assert "within_budget" in report
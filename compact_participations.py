@@ -0,0 +1,25 @@
+# compact_participations.py
+#
+# 오래된 참여 이벤트를 (매칭, 날짜) 별로 집계하고 원본은 삭제.
+# 발송 완료(SENT)된 알림 outbox 도 같은 기준으로 정리.
+# cron 등으로 주기 실행:  python compact_participations.py [보관일수, 기본 30]
+
+import sys
+from datetime import datetime, timedelta, timezone
+
+from backend.app.db.session import SessionLocal
+from backend.app.services.outbox import purge_sent_outbox
+from backend.app.services.participation import compact_participation_events
+
+keep_days = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+before = datetime.now(timezone.utc) - timedelta(days=keep_days)
+
+db = SessionLocal()
+try:
+    removed = compact_participation_events(db, before)
+    purged = purge_sent_outbox(db, before)
+finally:
+    db.close()
+
+print(f"🧹 참여 이벤트 {removed}개 집계 후 삭제 ({keep_days}일 이전)")
+print(f"🧹 발송 완료 알림 {purged}개 삭제 ({keep_days}일 이전)")
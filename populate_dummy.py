@@ -5,9 +5,12 @@ import random
 
 from backend.app.db.session import SessionLocal
 from backend.app.models.match import Match
+from backend.app.models.sport import Sport
 
 db = SessionLocal()
 
+basketball = db.query(Sport).filter(Sport.code == "basketball").first()
+
 # -----------------------------
 # 농구 장소 리스트
 # -----------------------------
@@ -54,6 +57,7 @@ for i in range(10):
             title=f"농구 매칭 #{i+1}",
             description="테스트용 더미 농구 매칭",
             sport="농구",
+            sport_id=basketball.id if basketball else None,
             location=random.choice(locations),
             date=random_date(),
             start_time=start_t,